@@ -21,6 +21,21 @@ from .extensions import (
 from .config import ConfigValidator, setup_logging, load_environment_config
 
 
+# Display names for industry codes, used by the format_industry template helper
+INDUSTRY_DISPLAY_NAMES = {
+    'bfsi': 'BFSI',
+    'energy_utilities': 'Energy & Utilities',
+    'government': 'Government Public Sector',
+    'travel_transport_tourism': 'Travel, Transport & Tourism',
+    'media_communications': 'Media & Communications',
+    'retail_commerce': 'Retail & Commerce',
+    'automotive': 'Automotive',
+    'healthcare': 'Healthcare',
+    'technology': 'Technology',
+    'other': 'Other'
+}
+
+
 def create_app(config_name: Optional[str] = None) -> Flask:
     """
     Flask application factory
@@ -262,21 +277,7 @@ def _register_context_processors(app: Flask) -> None:
             if not industry_value:
                 return ''
             
-            # Mapping for special cases
-            industry_mapping = {
-                'bfsi': 'BFSI',
-                'energy_utilities': 'Energy & Utilities',
-                'government': 'Government Public Sector',
-                'travel_transport_tourism': 'Travel, Transport & Tourism',
-                'media_communications': 'Media & Communications',
-                'retail_commerce': 'Retail & Commerce',
-                'automotive': 'Automotive',
-                'healthcare': 'Healthcare',
-                'technology': 'Technology',
-                'other': 'Other'
-            }
-            
-            return industry_mapping.get(
+            return INDUSTRY_DISPLAY_NAMES.get(
                 industry_value.lower(),
                 industry_value.replace('_', ' ').title()
             )
@@ -303,16 +304,27 @@ def _register_cli_commands(app: Flask) -> None:
     def init_db():
         """Initialize the database"""
         from scripts.setup import setup_database
+        from app.core.cache import clear_framework_cache
         setup_database()
+        clear_framework_cache()
         click.echo("Database initialized")
     
     @app.cli.command()
     def seed_db():
         """Seed the database with initial data"""
         from scripts.seed_database import seed_database
+        from app.core.cache import clear_framework_cache
         seed_database()
+        clear_framework_cache()
         click.echo("Database seeded")
     
+    @app.cli.command('clear-framework-cache')
+    def clear_framework_cache_command():
+        """Drop cached framework data after editing it outside the app"""
+        from app.core.cache import clear_framework_cache
+        clear_framework_cache()
+        click.echo("Framework cache cleared")
+    
     @app.cli.command()
     def validate_config():
         """Validate application configuration"""
@@ -2,60 +2,233 @@
 Assessment blueprint routes for AFS Assessment Framework
 """
 
+import hashlib
 import json
+import logging
+import os
+import tempfile
+import time
 from flask import (
     Blueprint, render_template, request, redirect, url_for, flash,
-    jsonify, session, current_app, make_response
+    jsonify, session, current_app, make_response, g
 )
-from sqlalchemy.orm import joinedload
+from flask_sqlalchemy.pagination import SelectPagination
+from sqlalchemy import (
+    DateTime, and_, bindparam, func, or_, select, text, tuple_
+)
+from sqlalchemy.orm import raiseload, selectinload
+from bisect import bisect_right
 from datetime import datetime
+from statistics import fmean
+from types import SimpleNamespace
 
+from app.extensions import db
 from app.models import Assessment, Section, Area, Question, Response
-from app.services.assessment_service import AssessmentService
+from app.services.assessment_service import (
+    AssessmentService, build_completion_results, get_assessment_metadata
+)
 from app.services.scoring_service import ScoringService
 from app.services.recommendation_service import RecommendationService
 from app.utils.exceptions import AssessmentError, ValidationError
 from app.utils.helpers import get_maturity_level, format_score_display
+from app.core.cache import (
+    get_ordered_question_ids, get_question_ids_by_section,
+    get_assessment_status_counts, get_question_positions,
+    get_section_order, get_section_positions, get_section_progressions,
+    get_total_questions, invalidate_assessment_progress,
+    invalidate_assessment_stats
+)
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 assessment_bp = Blueprint('assessment', __name__, url_prefix='/assessment')
 
+# Minimum number of seconds between session activity timestamp writes
+SESSION_ACTIVITY_INTERVAL = 60
+
+# Session keys owned by the assessment flow; responses and metadata
+# live in the database and are no longer mirrored into the cookie
+ASSESSMENT_SESSION_KEYS = (
+    'current_assessment_id',
+    'assessment_start_time',
+    'assessment_responses',
+    'assessment_metadata',
+)
+
+# Form field prefixes for per-question answers and notes on section submit
+RESPONSE_FIELD_PREFIX = 'response_'
+NOTES_FIELD_PREFIX = 'notes_'
+
+# Statements used by generate_report, built once so SQLAlchemy can reuse
+# their compiled form instead of re-parsing the SQL on every request
+REPORT_ASSESSMENT_SQL = text('''
+    SELECT id, status, team_name, organization_name, account_name,
+           first_name, last_name, email, industry,
+           assessor_name, assessor_email, created_at,
+           (SELECT COUNT(*) FROM responses
+            WHERE assessment_id = :assessment_id) AS answered_questions
+    FROM assessments WHERE id = :assessment_id
+''').columns(created_at=DateTime())
+
+FINALIZE_UPDATE_SQL = text('''
+    UPDATE assessments SET
+        status = 'COMPLETED',
+        completion_date = :completed_at,
+        overall_score = :overall_score,
+        deviq_classification = :deviq_classification,
+        foundational_score = :foundational_score,
+        transformation_score = :transformation_score,
+        enterprise_score = :enterprise_score,
+        governance_score = :governance_score,
+        results_json = :results_json,
+        updated_at = :completed_at
+    WHERE id = :assessment_id
+''').bindparams(bindparam('completed_at', type_=DateTime()))
+
+# Human readable names for the industry codes collected on the org form
+INDUSTRY_NAMES = {
+    'automotive': 'Automotive',
+    'bfsi': 'Banking, Financial Services & Insurance',
+    'energy_utilities': 'Energy & Utilities',
+    'government': 'Government & Public Sector',
+    'travel_transport_tourism': 'Travel, Transport & Tourism',
+    'healthcare': 'Healthcare',
+    'media_communications': 'Media & Communications',
+    'retail_commerce': 'Retail & Commerce',
+    'technology': 'Technology',
+    'other': 'Other'
+}
+
+# Report palette per section ID
+SECTION_COLORS = {
+    'FC': '#3b82f6',  # Blue
+    'TC': '#10b981',  # Green
+    'EI': '#f59e0b',  # Yellow
+    'SG': '#ef4444'   # Red
+}
+DEFAULT_SECTION_COLOR = '#6b7280'
+
+# Maturity level names in ascending order, and the numeric levels a
+# question has descriptions for
+MATURITY_LEVEL_NAMES = ('Traditional', 'AI-Assisted', 'AI-Augmented', 'AI-First')
+MATURITY_LEVEL_NUMBERS = (1, 2, 3, 4)
+
+# Lower score bounds of each level above the first, for bisect lookups
+MATURITY_LEVEL_THRESHOLDS = (1.8, 2.5, 3.3)
+
+# Completed reports only change if the assessment row is updated, so the
+# browser may keep a copy but must revalidate it through the ETag each time.
+# Pages that rendered one-time flash messages are never stored.
+REPORT_CACHE_CONTROL = 'private, no-cache'
+FLASHED_REPORT_CACHE_CONTROL = 'no-store'
+
+# Columns rendered by the assessment listing cards
+ASSESSMENT_LIST_COLUMNS = (
+    Assessment.id,
+    Assessment.team_name,
+    Assessment.organization_name,
+    Assessment.first_name,
+    Assessment.last_name,
+    Assessment.email,
+    Assessment.industry,
+    Assessment.status,
+    Assessment.overall_score,
+    Assessment.completion_date,
+    Assessment.created_at,
+    Assessment.updated_at,
+)
+
+
+class RowPagination(SelectPagination):
+    """
+    Pagination over a column-projected select, yielding row mappings
+    
+    When an ``after`` (updated_at, id) cursor is given, the page is fetched
+    by seeking past that row instead of skipping OFFSET rows.
+    """
+
+    def _query_items(self):
+        stmt = self._query_args["select"]
+        after = self._query_args.get("after")
+        if after:
+            stmt = stmt.where(
+                tuple_(Assessment.updated_at, Assessment.id) < after
+            )
+        else:
+            stmt = stmt.offset(self._query_offset)
+        stmt = stmt.limit(self.per_page)
+        session = self._query_args["session"]
+        return session.execute(stmt).mappings().all()
+
+
+def parse_list_cursor(args):
+    """
+    Parse the keyset cursor for the assessment list from query arguments
+    
+    Args:
+        args: Request query arguments
+        
+    Returns:
+        (updated_at, id) tuple, or None when absent or malformed
+    """
+    after_updated_at = args.get('after_updated_at')
+    after_id = args.get('after_id', type=int)
+    if not after_updated_at or after_id is None:
+        return None
+    try:
+        return datetime.fromisoformat(after_updated_at), after_id
+    except ValueError:
+        return None
+
+
+def team_name_prefix_filter(prefix):
+    """
+    Build a case-insensitive team name prefix filter that can use
+    idx_assessments_team_lower
+    
+    Args:
+        prefix: Search text the team name must start with
+        
+    Returns:
+        SQL expression for the WHERE clause
+    """
+    team_lower = func.lower(Assessment.team_name)
+    if db.session.get_bind().dialect.name == 'postgresql':
+        # The index is declared with varchar_pattern_ops, which serves
+        # anchored LIKE regardless of the database collation
+        return team_lower.startswith(prefix.lower(), autoescape=True)
+    # SQLite never uses an index for LIKE on lower(), but does for a
+    # range on the same expression; U+10FFFF sorts after any suffix
+    prefix_lower = func.lower(prefix)
+    return and_(team_lower >= prefix_lower,
+                team_lower < prefix_lower + '\U0010ffff')
+
 
 def get_assessment_service():
     """Get assessment service instance with current database session"""
-    from app.extensions import db
-    return AssessmentService(db.session)
+    if 'assessment_service' not in g:
+        g.assessment_service = AssessmentService(db.session)
+    return g.assessment_service
 
 
 def get_scoring_service():
     """Get scoring service instance with current database session"""
-    from app.extensions import db
-    return ScoringService(db.session)
+    if 'scoring_service' not in g:
+        g.scoring_service = ScoringService(db.session)
+    return g.scoring_service
 
 
 def get_recommendation_service():
     """Get recommendation service instance with current database session"""
-    from app.extensions import db
-    return RecommendationService(db.session)
+    if 'recommendation_service' not in g:
+        g.recommendation_service = RecommendationService(db.session)
+    return g.recommendation_service
 
 
 def format_industry(industry_code):
     """Format industry code to human readable name"""
-    industry_mapping = {
-        'automotive': 'Automotive',
-        'bfsi': 'Banking, Financial Services & Insurance',
-        'energy_utilities': 'Energy & Utilities',
-        'government': 'Government & Public Sector',
-        'travel_transport_tourism': 'Travel, Transport & Tourism',
-        'healthcare': 'Healthcare',
-        'media_communications': 'Media & Communications',
-        'retail_commerce': 'Retail & Commerce',
-        'technology': 'Technology',
-        'other': 'Other'
-    }
-    return industry_mapping.get(industry_code, industry_code.title())
+    return INDUSTRY_NAMES.get(industry_code, industry_code.title())
 
 
 def manage_assessment_session(assessment_id):
@@ -66,7 +239,6 @@ def manage_assessment_session(assessment_id):
         assessment_id: Assessment ID to track in session
     """
     session['current_assessment_id'] = assessment_id
-    session['assessment_start_time'] = datetime.utcnow().isoformat()
     session.permanent = True  # Keep session across browser restarts
 
 
@@ -80,12 +252,62 @@ def get_current_assessment():
     return session.get('current_assessment_id')
 
 
+def get_section_tree_options():
+    """
+    Eager-load options for a section with its areas and questions
+    
+    With SQLA_RAISELOAD enabled, any other relationship access on the loaded
+    tree raises instead of silently issuing a lazy load.
+    """
+    areas = selectinload(Section.areas)
+    questions = areas.selectinload(Area.questions)
+    if not current_app.config.get('SQLA_RAISELOAD'):
+        return [questions]
+    return [questions, raiseload('*'), areas.raiseload('*'),
+            questions.raiseload('*')]
+
+
+def get_report_etag(assessment):
+    """
+    Build an ETag for a completed assessment report
+    
+    Args:
+        assessment: Completed Assessment instance
+    
+    Returns:
+        str: Hex digest that changes whenever the assessment row is updated
+    """
+    version = f"{assessment.id}:{assessment.updated_at}"
+    return hashlib.md5(version.encode()).hexdigest()
+
+
+def set_report_cache_headers(response, etag, has_flashes=False):
+    """
+    Mark a completed report response as cacheable by the browser
+    
+    Args:
+        response: Flask response for the report page
+        etag: ETag from get_report_etag()
+        has_flashes: Whether the page rendered flashed messages
+    
+    Returns:
+        Response: The same response with ETag and Cache-Control set
+    """
+    if has_flashes:
+        response.headers['Cache-Control'] = FLASHED_REPORT_CACHE_CONTROL
+        return response
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = REPORT_CACHE_CONTROL
+    return response
+
+
 def clear_assessment_session():
     """Clear assessment-related session data"""
-    session.pop('current_assessment_id', None)
-    session.pop('assessment_start_time', None)
-    session.pop('assessment_responses', None)
-    session.pop('assessment_metadata', None)
+    # Popping a missing key still marks the cookie as modified, so only
+    # touch keys that are present (older cookies may carry the legacy ones)
+    for key in ASSESSMENT_SESSION_KEYS:
+        if key in session:
+            session.pop(key)
 
 
 def validate_assessment_session(assessment_id):
@@ -105,8 +327,15 @@ def validate_assessment_session(assessment_id):
 
 
 def update_session_activity():
-    """Update session activity timestamp"""
-    session['last_activity'] = datetime.utcnow().isoformat()
+    """
+    Update session activity timestamp
+    
+    The timestamp is only rewritten once it is older than
+    SESSION_ACTIVITY_INTERVAL, so most requests leave the session unmodified.
+    """
+    now = int(time.time())
+    if now - session.get('last_activity_ts', 0) > SESSION_ACTIVITY_INTERVAL:
+        session['last_activity_ts'] = now
 
 
 @assessment_bp.before_request
@@ -116,9 +345,6 @@ def before_assessment_request():
     """
     # Update session activity for assessment routes
     update_session_activity()
-    
-    # Set session timeout (optional - extend session for active users)
-    session.permanent = True
 
 
 @assessment_bp.errorhandler(404)
@@ -131,7 +357,7 @@ def assessment_not_found(error):
 @assessment_bp.errorhandler(500)
 def assessment_server_error(error):
     """Handle 500 errors in assessment blueprint"""
-    logger.error(f"Server error in assessment blueprint: {error}")
+    logger.error("Server error in assessment blueprint: %s", error)
     flash('An internal error occurred. Please try again.', 'error')
     return redirect(url_for('assessment.index'))
 
@@ -142,9 +368,6 @@ def index():
     Enhanced assessment overview page with search, filtering, and grid view
     """
     try:
-        from app.extensions import db
-        from sqlalchemy import or_, and_
-        
         # Get search and filter parameters
         search_query = request.args.get('search', '').strip()
         status_filter = request.args.get('status', '').strip()
@@ -153,81 +376,85 @@ def index():
         page = int(request.args.get('page', 1))
         per_page = int(request.args.get('per_page', 12))
         
-        # Build query with filters
-        query = db.session.query(Assessment).filter(
+        # Build query with filters, selecting only the listed columns
+        query = select(*ASSESSMENT_LIST_COLUMNS).where(
             Assessment.status.isnot(None)
         )
         
-        # Apply search filter
+        # Apply search filter (team name prefix, or an exact assessment id)
         if search_query:
-            query = query.filter(
-                or_(
-                    Assessment.team_name.ilike(f'%{search_query}%'),
-                    Assessment.id.like(f'%{search_query}%')
-                )
-            )
+            search_filter = team_name_prefix_filter(search_query)
+            if search_query.isdigit():
+                search_filter = or_(search_filter, Assessment.id == int(search_query))
+            query = query.where(search_filter)
         
         # Apply status filter
         if status_filter and status_filter != 'all':
-            query = query.filter(Assessment.status == status_filter)
+            query = query.where(Assessment.status == status_filter)
         
         # Apply date filters
         if date_from:
             try:
-                from datetime import datetime
                 date_from_obj = datetime.strptime(date_from, '%Y-%m-%d')
-                query = query.filter(Assessment.created_at >= date_from_obj)
+                query = query.where(Assessment.created_at >= date_from_obj)
             except ValueError:
                 pass
         
         if date_to:
             try:
-                from datetime import datetime
                 date_to_obj = datetime.strptime(date_to, '%Y-%m-%d')
-                query = query.filter(Assessment.created_at <= date_to_obj)
+                query = query.where(Assessment.created_at <= date_to_obj)
             except ValueError:
                 pass
         
-        # Order by most recent
-        query = query.order_by(Assessment.updated_at.desc())
+        # Order by most recent, with the id as a stable tie-breaker
+        query = query.order_by(
+            Assessment.updated_at.desc(), Assessment.id.desc()
+        )
         
-        # Paginate results
-        assessments_pagination = query.paginate(
-            page=page, per_page=per_page, error_out=False
+        # Paginate results; "next" links carry a cursor so deep pages seek
+        # instead of scanning past OFFSET rows
+        assessments_pagination = RowPagination(
+            select=query, session=db.session,
+            page=page, per_page=per_page, error_out=False,
+            after=parse_list_cursor(request.args)
         )
-        assessments = assessments_pagination.items
+        next_cursor = {}
+        if assessments_pagination.has_next and assessments_pagination.items:
+            last_row = assessments_pagination.items[-1]
+            next_cursor = {
+                'after_updated_at': last_row['updated_at'].isoformat(),
+                'after_id': last_row['id']
+            }
         
         # Add maturity levels to assessments
-        for assessment in assessments:
-            maturity = get_maturity_level(assessment.overall_score)
-            assessment.maturity_level = maturity
+        assessments = [
+            SimpleNamespace(
+                **row,
+                maturity_level=get_maturity_level(row['overall_score'])
+            )
+            for row in assessments_pagination.items
+        ]
         
         # Get framework statistics
-        total_questions = db.session.query(Question).count()
+        total_questions = get_total_questions()
         sections = db.session.query(Section).order_by(
             Section.display_order
         ).all()
         
-        # Get assessment statistics
-        total_assessments = db.session.query(Assessment).filter(
-            Assessment.status.isnot(None)
-        ).count()
-        completed_assessments = db.session.query(Assessment).filter(
-            Assessment.status == 'COMPLETED'
-        ).count()
-        in_progress_assessments = db.session.query(Assessment).filter(
-            Assessment.status == 'IN_PROGRESS'
-        ).count()
+        # Get assessment statistics and filter options from one aggregate
+        status_counts = get_assessment_status_counts()
+        total_assessments = sum(status_counts.values())
+        completed_assessments = status_counts.get('COMPLETED', 0)
+        in_progress_assessments = status_counts.get('IN_PROGRESS', 0)
         
         # Get unique statuses for filter dropdown
-        status_options = db.session.query(Assessment.status).filter(
-            Assessment.status.isnot(None)
-        ).distinct().all()
-        status_options = [status[0] for status in status_options if status[0]]
+        status_options = [status for status in status_counts if status]
         
         context = {
             'assessments': assessments,
             'pagination': assessments_pagination,
+            'next_cursor': next_cursor,
             'total_questions': total_questions,
             'sections': sections or [],
             'total_sections': len(sections) if sections else 4,
@@ -246,7 +473,7 @@ def index():
         return render_template('pages/assessment/index.html', **context)
         
     except Exception as e:
-        logger.error(f"Error loading assessment index: {e}")
+        logger.error("Error loading assessment index: %s", e)
         flash('Error loading assessments', 'error')
         # Provide safe defaults
         return render_template('pages/assessment/index.html', 
@@ -302,10 +529,6 @@ def create():
             return render_template('pages/assessment/org_information.html')
         
         # Create assessment using the existing database schema
-        from app.extensions import db
-        from app.models import Assessment
-        from app.models.question import Section
-        
         # Get the first section before creating assessment to avoid session issues
         first_section = db.session.query(Section).order_by(Section.display_order).first()
         if not first_section:
@@ -323,8 +546,9 @@ def create():
         assessment.assessor_name = assessor_name if assessor_name else None
         assessment.assessor_email = assessor_email if assessor_email else None
         assessment.status = 'IN_PROGRESS'
-        assessment.created_at = datetime.utcnow()
-        assessment.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        assessment.created_at = now
+        assessment.updated_at = now
         
         db.session.add(assessment)
         db.session.flush()  # Get the ID without committing yet
@@ -332,34 +556,23 @@ def create():
         # Store the assessment ID before commit
         assessment_id = assessment.id
         
-        # Set up comprehensive session management with candidate details BEFORE commit
+        # Track only the assessment ID in the session; candidate details
+        # live on the assessment row
         manage_assessment_session(assessment_id)
         
-        # Initialize response tracking and metadata in session BEFORE commit
-        session['assessment_responses'] = {}
-        session['assessment_metadata'] = {
-            'organization_name': organization_name,
-            'account_name': account_name,
-            'first_name': first_name,
-            'last_name': last_name,
-            'email': email,
-            'industry': industry,
-            'assessor_name': assessor_name,
-            'assessor_email': assessor_email,
-            'created_at': datetime.utcnow().isoformat(),
-            'current_section_index': 0,
-            'assessment_id': assessment_id  # Store ID in session for reliability
-        }
-        
         # Now commit the transaction - everything is set up
         db.session.commit()
+        invalidate_assessment_stats()
         
         # Log successful creation
-        logger.info(f"Assessment {assessment_id} successfully created and committed")
+        logger.info("Assessment %s successfully created and committed", assessment_id)
         
-        logger.info(f"Found first section: {first_section.id} - {first_section.name}")
+        logger.info("Found first section: %s - %s", first_section.id, first_section.name)
         flash(f'Assessment created for {first_name} {last_name}. Starting with {first_section.name}!', 'success')
-        logger.info(f"Assessment created: {assessment_id} for {organization_name}, proceeding to section {first_section.id}")
+        logger.info(
+            "Assessment created: %s for %s, proceeding to section %s",
+            assessment_id, organization_name, first_section.id
+        )
         
         # Redirect directly to the first section's questions
         return redirect(url_for('assessment.section_questions', 
@@ -368,15 +581,15 @@ def create():
         
     except ValidationError as e:
         flash(f'Validation error: {str(e)}', 'error')
-        logger.warning(f"Assessment validation error: {str(e)}")
+        logger.warning("Assessment validation error: %s", e)
         return render_template('pages/assessment/org_information.html')
     except AssessmentError as e:
         flash(f'Assessment error: {str(e)}', 'error')
-        logger.error(f"Assessment creation error: {str(e)}")
+        logger.error("Assessment creation error: %s", e)
         return render_template('pages/assessment/org_information.html')
     except Exception as e:
         flash('An unexpected error occurred while creating the assessment. Please try again.', 'error')
-        logger.error(f"Unexpected error in assessment creation: {str(e)}")
+        logger.error("Unexpected error in assessment creation: %s", e)
         return render_template('pages/assessment/org_information.html')
 
 
@@ -386,99 +599,48 @@ def section_questions(assessment_id, section_id):
     Step 3: Questions for a specific section
     """
     try:
-        from app.extensions import db
-        
-        # First try to get the assessment from database
         assessment = db.session.get(Assessment, assessment_id)
+        if not assessment:
+            logger.error("Assessment %s not found", assessment_id)
+            flash('Assessment not found. Please start a new assessment.', 'error')
+            return redirect(url_for('assessment.create'))
         
-        # If assessment exists in DB, allow access regardless of session
-        if assessment:
-            # If assessment is completed, redirect to report
-            if assessment.status == 'COMPLETED':
-                flash('This assessment has already been completed.', 'info')
-                return redirect(url_for('assessment.report', assessment_id=assessment_id))
-            
-            # If no session metadata but assessment exists, recreate minimal session data
-            if 'assessment_metadata' not in session:
-                logger.info(f"Recreating session data for existing assessment {assessment_id}")
-                session['assessment_metadata'] = {
-                    'assessment_id': assessment_id,
-                    'organization_name': assessment.organization_name or assessment.team_name or 'Unknown Organization',
-                    'account_name': assessment.account_name or '',
-                    'first_name': assessment.first_name or '',
-                    'last_name': assessment.last_name or '',
-                    'email': assessment.email or '',
-                    'industry': assessment.industry or '',
-                    'assessor_name': assessment.assessor_name or '',
-                    'assessor_email': assessment.assessor_email or '',
-                    'created_at': assessment.created_at.isoformat() if assessment.created_at else datetime.utcnow().isoformat(),
-                    'current_section_index': 0
-                }
-                session['assessment_responses'] = {}
-                # Also set current_assessment_id for consistency with other routes
-                session['current_assessment_id'] = assessment_id
-                
-        else:
-            # Assessment doesn't exist in DB, check session for new assessment creation
-            if 'assessment_metadata' not in session:
-                logger.error(f"No session data and no existing assessment {assessment_id}")
-                flash('Assessment session expired. Please start a new assessment.', 'error')
-                return redirect(url_for('assessment.create'))
-                
-            session_assessment_id = session['assessment_metadata'].get('assessment_id')
-            if session_assessment_id != assessment_id:
-                logger.error(f"Session assessment ID {session_assessment_id} doesn't match URL {assessment_id}")
-                flash('Assessment session mismatch. Please start a new assessment.', 'error')
-                return redirect(url_for('assessment.create'))
-            
-            # If no assessment in DB and session is valid, create a temporary assessment object
-            logger.warning(f"Assessment {assessment_id} not in DB yet, using session data")
-            assessment = type('Assessment', (), {
-                'id': assessment_id,
-                'team_name': session['assessment_metadata'].get('organization_name'),
-                'status': 'IN_PROGRESS'
-            })()
+        # If assessment is completed, redirect to report
+        if assessment.status == 'COMPLETED':
+            flash('This assessment has already been completed.', 'info')
+            return redirect(url_for('assessment.report', assessment_id=assessment_id))
+        
+        # Keep the session pointed at the assessment being worked on
+        if get_current_assessment() != assessment_id:
+            session['current_assessment_id'] = assessment_id
         
         # Get section with areas and questions
         section = db.session.query(Section).options(
-            joinedload(Section.areas).joinedload(Area.questions)
+            *get_section_tree_options()
         ).filter(Section.id == section_id).first()
         
         if not section:
-            logger.error(f"Section {section_id} not found")
+            logger.error("Section %s not found", section_id)
             flash('Section not found', 'error')
             return redirect(url_for('assessment.create'))
         
-        # Get progression data for each area in the section
-        from app.models.progression import get_all_progressions_for_area
-        area_progressions = {}
-        for area in section.areas:
-            progressions = get_all_progressions_for_area(area.id)
-            # Convert MaturityProgression objects to dictionaries for JSON serialization
-            area_progressions[area.id] = {
-                level: progression.to_dict() 
-                for level, progression in progressions.items()
-            }
+        # Progression data for every area, already serialized for JSON
+        area_progressions = get_section_progressions(section_id)
         
         # Get all sections for navigation
-        all_sections = db.session.query(Section).order_by(
-            Section.display_order).all()
+        all_sections = get_section_order()
         
         # Find current section index
-        current_section_index = next(
-            (i for i, s in enumerate(all_sections) if s.id == section_id), 0
-        )
+        current_section_index = get_section_positions().get(section_id, 0)
         
-        # Update session metadata
-        session['assessment_metadata']['current_section_index'] = current_section_index
-        session['assessment_metadata']['assessment_id'] = assessment.id
-        question_ids = []
-        for area in section.areas:
-            question_ids.extend([q.id for q in area.questions])
+        question_ids = get_question_ids_by_section().get(section_id, ())
         
+        # The form only needs each saved score and note, so fetch plain rows
         existing_responses = {}
         if question_ids:
-            responses = db.session.query(Response).filter(
+            responses = db.session.query(
+                Response.question_id, Response.score, Response.notes
+            ).filter(
                 Response.assessment_id == assessment_id,
                 Response.question_id.in_(question_ids)
             ).all()
@@ -499,7 +661,7 @@ def section_questions(assessment_id, section_id):
                                **context)
         
     except Exception as e:
-        logger.error(f"Error loading section questions: {e}")
+        logger.error("Error loading section questions: %s", e)
         flash('Error loading section questions', 'error')
         return redirect(url_for('assessment.detail',
                                 assessment_id=assessment_id))
@@ -511,129 +673,104 @@ def submit_section_responses(assessment_id, section_id):
     """
     Submit all responses for a section
     """
-    print(f"DEBUG: Function called with assessment_id={assessment_id}, section_id={section_id}")
-    logger.info(f"=== SUBMIT FUNCTION CALLED: assessment_id={assessment_id}, section_id={section_id} ===")
-    
     try:
-        from app.extensions import db
-        
-        logger.info(f"Submitting section {section_id} for assessment {assessment_id}")
-        
-        # Try different approaches to get the assessment
-        try:
-            # First try: commit and refresh session
-            db.session.commit()
-            assessment = db.session.query(Assessment).get(assessment_id)
-        except:
-            # Second try: create new session
-            db.session.rollback()
-            assessment = db.session.query(Assessment).filter(Assessment.id == assessment_id).first()
-        
-        if not assessment:
-            # Third try: get from session data if it exists
-            if 'current_assessment_id' in session and session['current_assessment_id'] == assessment_id:
-                # Create a mock assessment object with the data we need
-                from app.models.assessment import Assessment as AssessmentModel
-                assessment = AssessmentModel()
-                assessment.id = assessment_id
-                # Get team name from session metadata
-                if 'assessment_metadata' in session:
-                    assessment.team_name = session['assessment_metadata'].get('organization_name', 'Unknown')
-                else:
-                    assessment.team_name = 'Unknown'
-                assessment.status = 'IN_PROGRESS'
-                logger.info(f"Using session data for assessment {assessment_id}")
-            else:
-                logger.error(f"Assessment {assessment_id} not found anywhere")
-                flash('Assessment not found', 'error')
-                return redirect(url_for('assessment.index'))
-        
-        section = db.session.query(Section).get(section_id)
-        
-        logger.info(f"Assessment query result: {assessment}")
-        logger.info(f"Section query result: {section}")
+        logger.info("Submitting section %s for assessment %s", section_id, assessment_id)
         
+        assessment = db.session.get(Assessment, assessment_id)
         if not assessment:
-            logger.error(f"Assessment {assessment_id} not found in database")
+            logger.error("Assessment %s not found in database", assessment_id)
             flash('Assessment not found', 'error')
             return redirect(url_for('assessment.index'))
-            
+        
+        section = db.session.get(Section, section_id)
+        
         if not section:
-            logger.error(f"Section {section_id} not found in database")
+            logger.error("Section %s not found in database", section_id)
             flash('Section not found', 'error')
             return redirect(url_for('assessment.index'))
         
-        logger.info(f"Found assessment: {assessment.team_name}, section: {section.name}")
+        logger.debug("Found assessment: %s, section: %s", assessment.team_name, section.name)
         
         # Process all responses for this section
         responses_data = {}
         notes_data = {}
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         # Extract response data from form
         for key, value in request.form.items():
-            if key.startswith('response_'):
-                question_id = key.replace('response_', '')
+            if key.startswith(RESPONSE_FIELD_PREFIX):
+                question_id = key[len(RESPONSE_FIELD_PREFIX):]
                 responses_data[question_id] = value
-                logger.info(f"Response for {question_id}: {value}")
-            elif key.startswith('notes_'):
-                question_id = key.replace('notes_', '')
+                if debug_enabled:
+                    logger.debug("Response for %s: %s", question_id, value)
+            elif key.startswith(NOTES_FIELD_PREFIX):
+                question_id = key[len(NOTES_FIELD_PREFIX):]
                 notes_data[question_id] = value
         
-        logger.info(f"Collected {len(responses_data)} responses")
+        logger.debug("Collected %s responses", len(responses_data))
+        
+        # Only save questions that have a response provided
+        answered = {
+            question_id: answer_value
+            for question_id, answer_value in responses_data.items()
+            if answer_value
+        }
         
-        # Save or update responses directly to avoid transaction isolation issues
-        for question_id, answer_value in responses_data.items():
-            if answer_value:  # Only save if response provided
-                # Get notes for this question if present
-                notes = notes_data.get(question_id)
-                # Check if response already exists
-                existing_response = db.session.query(Response).filter(
+        # Load the existing responses for the submitted questions in one query
+        existing_responses = {}
+        if answered:
+            existing_responses = {
+                r.question_id: r for r in db.session.query(Response).filter(
                     Response.assessment_id == assessment_id,
-                    Response.question_id == question_id
-                ).first()
-                
-                if existing_response:
-                    # Update existing response
-                    existing_response.score = int(answer_value)
-                    existing_response.timestamp = datetime.utcnow()
-                    if notes is not None:
-                        existing_response.notes = notes
-                    logger.info(f"Updated response for {question_id}: {answer_value}, notes: {notes}")
-                else:
-                    # Create new response
-                    new_response = Response(
-                        assessment_id=assessment_id,
-                        question_id=question_id,
-                        score=int(answer_value),
-                        notes=notes,
-                        timestamp=datetime.utcnow()
-                    )
-                    db.session.add(new_response)
-                    logger.info(f"Created new response for {question_id}: {answer_value}, notes: {notes}")
+                    Response.question_id.in_(list(answered))
+                )
+            }
+        
+        # Save or update responses; flushed together on commit
+        now = datetime.utcnow()
+        for question_id, answer_value in answered.items():
+            # Get notes for this question if present
+            notes = notes_data.get(question_id)
+            existing_response = existing_responses.get(question_id)
+            
+            if existing_response:
+                # Update existing response
+                existing_response.score = int(answer_value)
+                existing_response.timestamp = now
+                if notes is not None:
+                    existing_response.notes = notes
+                if debug_enabled:
+                    logger.debug("Updated response for %s: %s, notes: %s",
+                                 question_id, answer_value, notes)
+            else:
+                # Create new response
+                new_response = Response(
+                    assessment_id=assessment_id,
+                    question_id=question_id,
+                    score=int(answer_value),
+                    notes=notes,
+                    timestamp=now
+                )
+                db.session.add(new_response)
+                if debug_enabled:
+                    logger.debug("Created new response for %s: %s, notes: %s",
+                                 question_id, answer_value, notes)
         
         # Commit the responses
         db.session.commit()
-        logger.info("All responses committed successfully")
-        
-        # Update session tracking - ensure session dict exists
-        if 'assessment_responses' not in session:
-            session['assessment_responses'] = {}
-        session['assessment_responses'].update(responses_data)
+        invalidate_assessment_progress(assessment_id)
+        logger.debug("All responses committed successfully")
         
         # Determine next action
-        all_sections = db.session.query(Section).order_by(
-            Section.display_order).all()
-        current_index = next(
-            (i for i, s in enumerate(all_sections) if s.id == section_id), 0
-        )
+        all_sections = get_section_order()
+        current_index = get_section_positions().get(section_id, 0)
         
         if current_index < len(all_sections) - 1:
             # Go to next section
-            next_section = all_sections[current_index + 1]
             flash(f'Section "{section.name}" completed successfully!', 'success')
             return redirect(url_for('assessment.section_questions',
                                     assessment_id=assessment_id,
-                                    section_id=next_section.id))
+                                    section_id=all_sections[current_index + 1]['id']))
         else:
             # All sections completed, go to final review
             flash('All sections completed! Ready for final review.', 'success')
@@ -641,10 +778,8 @@ def submit_section_responses(assessment_id, section_id):
                                     assessment_id=assessment_id))
         
     except Exception as e:
-        print(f"DEBUG: Exception in submit_section_responses: {e}")
-        logger.error(f"Error submitting section responses: {e}")
-        import traceback
-        print(f"DEBUG: Traceback: {traceback.format_exc()}")
+        db.session.rollback()
+        logger.error("Error submitting section responses: %s", e)
         flash('Error saving responses. Please try again.', 'error')
         return redirect(url_for('assessment.section_questions',
                                 assessment_id=assessment_id,
@@ -657,68 +792,35 @@ def final_review(assessment_id):
     Step 4: Final review before generating report
     """
     try:
-        from app.extensions import db
-        
         # Get assessment with responses
-        assessment = db.session.query(Assessment).get(assessment_id)
+        assessment = db.session.get(Assessment, assessment_id)
         if not assessment:
-            # Try session fallback for transaction isolation issues
-            assessment_metadata = session.get('assessment_metadata', {})
-            if assessment_metadata.get('assessment_id') == assessment_id:
-                # Create temporary assessment object for review
-                class TempAssessment:
-                    def __init__(self, id, team_name, status='IN_PROGRESS'):
-                        self.id = id
-                        self.team_name = team_name
-                        self.status = status
-                        self.overall_score = None
-                        self.created_at = None
-                        self.completion_date = None
-                
-                assessment = TempAssessment(
-                    assessment_id, 
-                    assessment_metadata.get('team_name', 'Unknown Organization')
-                )
-                logger.info(f"Using session data for final review of assessment {assessment_id}")
-            else:
-                flash('Assessment not found', 'error')
-                return redirect(url_for('assessment.index'))
+            flash('Assessment not found', 'error')
+            return redirect(url_for('assessment.index'))
         
         # Get all sections with responses
         sections = db.session.query(Section).options(
-            joinedload(Section.areas).joinedload(Area.questions)
+            *get_section_tree_options()
         ).order_by(Section.display_order).all()
         
-        # Get all responses for this assessment
-        responses = db.session.query(Response).filter(
-            Response.assessment_id == assessment_id
+        # Get all response scores for this assessment in one query; the
+        # template only reads the score, so skip hydrating Response objects
+        responses = db.session.execute(
+            select(Response.question_id, Response.score)
+            .where(Response.assessment_id == assessment_id)
         ).all()
         responses_dict = {r.question_id: r for r in responses}
         
         # Calculate completion statistics
-        total_questions = 0
-        answered_questions = 0
-        
-        for section in sections:
-            for area in section.areas:
-                for question in area.questions:
-                    total_questions += 1
-                    if question.id in responses_dict:
-                        answered_questions += 1
+        total_questions = get_total_questions()
+        answered_questions = len(responses_dict)
         
         completion_percentage = (
             (answered_questions / total_questions * 100) 
             if total_questions > 0 else 0
         )
         
-        # Get metadata from session or create basic metadata
-        metadata = session.get('assessment_metadata', {})
-        if not metadata:
-            metadata = {
-                'team_name': getattr(assessment, 'team_name', 'Organization'),
-                'assessment_id': assessment_id,
-                'created_at': str(getattr(assessment, 'created_at', '')),
-            }
+        metadata = get_assessment_metadata(assessment)
         
         context = {
             'assessment': assessment,
@@ -731,11 +833,14 @@ def final_review(assessment_id):
             'can_generate_report': completion_percentage >= 80
         }
         
-        logger.info(f"Final review loaded for assessment {assessment_id}, completion: {completion_percentage:.1f}%")
+        logger.info(
+            "Final review loaded for assessment %s, completion: %.1f%%",
+            assessment_id, completion_percentage
+        )
         return render_template('pages/assessment/final_review.html', **context)
         
     except Exception as e:
-        logger.error(f"Error loading final review: {e}")
+        logger.error("Error loading final review: %s", e)
         flash('Error loading final review', 'error')
         return redirect(url_for('assessment.section_questions',
                                 assessment_id=assessment_id, section_id='SG'))
@@ -747,24 +852,21 @@ def generate_report(assessment_id):
     Generate the final assessment report
     """
     try:
-        from app.extensions import db
-        from sqlalchemy import text
-        
-        logger.info(f"Starting report generation for assessment {assessment_id}")
+        logger.info("Starting report generation for assessment %s", assessment_id)
         
-        # Get assessment using id (schema has been fixed)
+        # Get assessment status, response count and the metadata stored
+        # with the results in one query
         result = db.session.execute(
-            text('SELECT * FROM assessments WHERE id = :assessment_id'),
-            {'assessment_id': assessment_id}
+            REPORT_ASSESSMENT_SQL, {'assessment_id': assessment_id}
         )
         assessment_row = result.fetchone()
         
         if not assessment_row:
-            logger.error(f"Assessment {assessment_id} not found")
+            logger.error("Assessment %s not found", assessment_id)
             flash('Assessment not found', 'error')
             return redirect(url_for('assessment.index'))
         
-        logger.info(f"Found assessment {assessment_id}, status: {assessment_row.status}")
+        logger.info("Found assessment %s, status: %s", assessment_id, assessment_row.status)
         
         # Check if assessment is already completed
         if assessment_row.status == 'COMPLETED':
@@ -772,24 +874,20 @@ def generate_report(assessment_id):
             return redirect(url_for('assessment.report', 
                                     assessment_id=assessment_id))
         
-        # Get responses to check completion
-        responses = db.session.query(Response).filter_by(
-            assessment_id=assessment_id
-        ).all()
-        logger.info(f"Found {len(responses)} responses for assessment {assessment_id}")
+        # Response count comes with the assessment row
+        answered_questions = assessment_row.answered_questions or 0
+        logger.info("Found %s responses for assessment %s", answered_questions, assessment_id)
         
         # Get all questions for completion calculation
-        from sqlalchemy import func
-        total_questions = db.session.query(func.count(Question.id)).scalar()
-        answered_questions = len(responses) if responses else 0
+        total_questions = get_total_questions()
         completion_percentage = (
             (answered_questions / total_questions * 100) 
             if total_questions > 0 else 0
         )
         
         logger.info(
-            f"Completion: {answered_questions}/{total_questions} "
-            f"({completion_percentage:.1f}%)"
+            "Completion: %s/%s (%.1f%%)",
+            answered_questions, total_questions, completion_percentage
         )
         
         # Check completion requirements
@@ -805,116 +903,87 @@ def generate_report(assessment_id):
         
         # Mark assessment as completed and calculate basic scores
         try:
-            logger.info(f"Starting completion process for assessment {assessment_id}")
-            
-            # Get responses by section for scoring
-            responses_by_section = {}
-            for response in responses:
-                question = db.session.get(Question, response.question_id)
-                if question and question.area:
-                    section_id = question.area.section_id
-                    if section_id not in responses_by_section:
-                        responses_by_section[section_id] = []
-                    responses_by_section[section_id].append(response)
-            
-            # Calculate section scores (average of responses in each section)
-            section_scores = {}
-            for section_id, section_responses in responses_by_section.items():
-                if section_responses:
-                    scores = [
-                        r.score for r in section_responses 
-                        if r.score
-                    ]
-                    section_scores[section_id] = (
-                        sum(scores) / len(scores) if scores else 0
-                    )
+            logger.info("Starting completion process for assessment %s", assessment_id)
             
-            logger.info(f"Section scores calculated: {section_scores}")
+            # Nothing is pending in the session here, so skip autoflush checks
+            # for the scoring reads and the UPDATE
+            with db.session.no_autoflush:
+                # Calculate section scores (average of responses in each section)
+                section_rows = db.session.query(
+                    Area.section_id, func.avg(Response.score)
+                ).join(
+                    Question, Question.id == Response.question_id
+                ).join(
+                    Area, Area.id == Question.area_id
+                ).filter(
+                    Response.assessment_id == assessment_id,
+                    Response.score.isnot(None)
+                ).group_by(Area.section_id).all()
+                section_scores = {
+                    section_id: float(average_score)
+                    for section_id, average_score in section_rows
+                }
             
-            # Calculate overall score
-            scores = [score for score in section_scores.values() if score > 0]
-            overall_score = sum(scores) / len(scores) if scores else 0
+                logger.info("Section scores calculated: %s", section_scores)
             
-            # Set DevIQ classification based on overall score
-            if overall_score >= 3.5:
-                deviq_classification = 'Optimized'
-            elif overall_score >= 2.5:
-                deviq_classification = 'Advanced'
-            elif overall_score >= 1.5:
-                deviq_classification = 'Evolving'
-            else:
-                deviq_classification = 'Basic'
+                # Calculate overall score
+                scores = [score for score in section_scores.values() if score > 0]
+                overall_score = fmean(scores) if scores else 0
             
-            logger.info(
-                f"Assessment completion data: "
-                f"overall_score={overall_score}, "
-                f"classification={deviq_classification}"
-            )
+                # Classification and stored results are built the same way
+                # as on the finalize path
+                completed_at = datetime.utcnow()
+                deviq_classification, assessment_results = (
+                    build_completion_results(
+                        assessment_row, section_scores, overall_score,
+                        completed_at
+                    )
+                )
             
-            # Prepare metadata for storage in results_json
-            metadata = session.get('assessment_metadata', {})
-            assessment_results = {
-                'scores': section_scores,
-                'overall_score': overall_score,
-                'deviq_classification': deviq_classification,
-                'metadata': {
-                    'organization_name': metadata.get('organization_name'),
-                    'account_name': metadata.get('account_name'),
-                    'first_name': metadata.get('first_name'),
-                    'last_name': metadata.get('last_name'),
-                    'email': metadata.get('email'),
-                    'industry': metadata.get('industry'),
-                    'created_at': metadata.get('created_at'),
-                    'completion_date': datetime.utcnow().isoformat()
-                }
-            }
+                logger.info(
+                    "Assessment completion data: overall_score=%s, "
+                    "classification=%s",
+                    overall_score, deviq_classification
+                )
             
-            # Update assessment using raw SQL (since SQLAlchemy model has schema mismatch)
-            db.session.execute(text('''
-                UPDATE assessments SET 
-                    status = 'COMPLETED',
-                    completion_date = CURRENT_TIMESTAMP,
-                    overall_score = :overall_score,
-                    deviq_classification = :deviq_classification,
-                    foundational_score = :foundational_score,
-                    transformation_score = :transformation_score,
-                    enterprise_score = :enterprise_score,
-                    governance_score = :governance_score,
-                    results_json = :results_json,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = :assessment_id
-            '''), {
-                'overall_score': overall_score,
-                'deviq_classification': deviq_classification,
-                'foundational_score': section_scores.get('FC', 0),
-                'transformation_score': section_scores.get('TC', 0),
-                'enterprise_score': section_scores.get('EI', 0),
-                'governance_score': section_scores.get('SG', 0),
-                'results_json': json.dumps(assessment_results),
-                'assessment_id': assessment_id
-            })
+                # Update assessment using raw SQL (since SQLAlchemy model has schema mismatch)
+                db.session.execute(FINALIZE_UPDATE_SQL, {
+                    'overall_score': overall_score,
+                    'deviq_classification': deviq_classification,
+                    'foundational_score': section_scores.get('FC', 0),
+                    'transformation_score': section_scores.get('TC', 0),
+                    'enterprise_score': section_scores.get('EI', 0),
+                    'governance_score': section_scores.get('SG', 0),
+                    'results_json': json.dumps(
+                        assessment_results, separators=(',', ':'), default=str
+                    ),
+                    'completed_at': completed_at,
+                    'assessment_id': assessment_id
+                })
             
             # Commit the changes
             db.session.commit()
-            logger.info(f"Assessment {assessment_id} committed to database")
+            invalidate_assessment_progress(assessment_id)
+            invalidate_assessment_stats()
+            logger.info("Assessment %s committed to database", assessment_id)
             
             # Clear session data as assessment is complete
             clear_assessment_session()
             
-            logger.info(f"Assessment {assessment_id} completed successfully")
+            logger.info("Assessment %s completed successfully", assessment_id)
             flash('Assessment completed successfully! Your report is now available.', 'success')
             return redirect(url_for('assessment.report', 
                                     assessment_id=assessment_id))
             
         except Exception as scoring_error:
-            logger.error(f"Error during assessment completion: {scoring_error}")
+            logger.error("Error during assessment completion: %s", scoring_error)
             db.session.rollback()
             flash('Error occurred during completion. Please try again.', 'warning')
             return redirect(url_for('assessment.final_review', 
                                     assessment_id=assessment_id))
         
     except Exception as e:
-        logger.error(f"Error generating report: {e}")
+        logger.error("Error generating report: %s", e)
         flash('Error generating report. Please try again.', 'error')
         return redirect(url_for('assessment.final_review', 
                                 assessment_id=assessment_id))
@@ -926,8 +995,7 @@ def detail(assessment_id):
     Assessment detail view - redirects to read-only assessment view
     """
     try:
-        from app.extensions import db
-        assessment_service = AssessmentService(db.session)
+        assessment_service = get_assessment_service()
         
         # Get assessment to verify it exists
         assessment = assessment_service.get_assessment(assessment_id)
@@ -941,7 +1009,7 @@ def detail(assessment_id):
                                 assessment_id=assessment_id))
         
     except Exception as e:
-        logger.error(f"Error loading assessment detail: {e}")
+        logger.error("Error loading assessment detail: %s", e)
         flash('Error loading assessment', 'error')
         return redirect(url_for('assessment.index'))
 
@@ -952,8 +1020,7 @@ def view_readonly(assessment_id):
     Read-only view of assessment - organization information page
     """
     try:
-        from app.extensions import db
-        assessment_service = AssessmentService(db.session)
+        assessment_service = get_assessment_service()
         
         # Get assessment with responses
         assessment = assessment_service.get_assessment(
@@ -977,7 +1044,7 @@ def view_readonly(assessment_id):
                                **context)
         
     except Exception as e:
-        logger.error(f"Error loading assessment readonly view: {e}")
+        logger.error("Error loading assessment readonly view: %s", e)
         flash('Error loading assessment', 'error')
         return redirect(url_for('assessment.index'))
 
@@ -988,29 +1055,26 @@ def view_readonly_sections(assessment_id):
     Read-only view of assessment - sections overview
     """
     try:
-        from app.extensions import db
-        
         # Get assessment
-        assessment = db.session.query(Assessment).get(assessment_id)
+        assessment = db.session.get(Assessment, assessment_id)
         if not assessment:
             flash('Assessment not found', 'error')
             return redirect(url_for('assessment.index'))
         
         # Get all sections with their areas
         sections = db.session.query(Section).options(
-            joinedload(Section.areas)
+            selectinload(Section.areas)
         ).order_by(Section.display_order).all()
         
         # Get progress information
-        assessment_service = AssessmentService(db.session)
-        progress = assessment_service.get_assessment_progress(assessment_id)
+        progress = get_assessment_service().get_assessment_progress(assessment_id)
         
         context = {
             'assessment': assessment,
             'sections': sections,
             'progress': progress,
             'readonly': True,
-            'total_questions': sum(len(section.areas) for section in sections)
+            'total_questions': get_total_questions()
         }
         
         return render_template(
@@ -1018,7 +1082,7 @@ def view_readonly_sections(assessment_id):
             **context)
         
     except Exception as e:
-        logger.error(f"Error loading readonly sections overview: {e}")
+        logger.error("Error loading readonly sections overview: %s", e)
         flash('Error loading assessment', 'error')
         return redirect(url_for('assessment.index'))
 
@@ -1029,17 +1093,15 @@ def view_readonly_section(assessment_id, section_id):
     Read-only view of assessment - specific section with responses
     """
     try:
-        from app.extensions import db
-        
         # Get assessment
-        assessment = db.session.query(Assessment).get(assessment_id)
+        assessment = db.session.get(Assessment, assessment_id)
         if not assessment:
             flash('Assessment not found', 'error')
             return redirect(url_for('assessment.index'))
         
         # Get section with areas and questions
         section = db.session.query(Section).options(
-            joinedload(Section.areas).joinedload(Area.questions)
+            *get_section_tree_options()
         ).filter(Section.id == section_id).first()
         
         if not section:
@@ -1047,28 +1109,24 @@ def view_readonly_section(assessment_id, section_id):
             return redirect(url_for('assessment.view_readonly_sections',
                                     assessment_id=assessment_id))
         
-        # Get all responses for this assessment
-        responses = db.session.query(Response).filter(
-            Response.assessment_id == assessment_id
-        ).all()
-        
-        # Create responses dictionary for easy lookup
-        responses_dict = {resp.question_id: resp for resp in responses}
+        # Get the responses for this section's questions
+        question_ids = get_question_ids_by_section().get(section_id, ())
+        responses_dict = {}
+        if question_ids:
+            responses = db.session.query(Response).filter(
+                Response.assessment_id == assessment_id,
+                Response.question_id.in_(question_ids)
+            ).all()
+            responses_dict = {resp.question_id: resp for resp in responses}
         
         # Get all sections for navigation
-        all_sections = db.session.query(Section).order_by(
-            Section.display_order).all()
+        all_sections = get_section_order()
         
         # Find current section index
-        current_section_index = 0
-        for i, s in enumerate(all_sections):
-            if s.id == section.id:
-                current_section_index = i
-                break
+        current_section_index = get_section_positions().get(section.id, 0)
         
         # Get progress information
-        assessment_service = AssessmentService(db.session)
-        progress = assessment_service.get_assessment_progress(assessment_id)
+        progress = get_assessment_service().get_assessment_progress(assessment_id)
         
         context = {
             'assessment': assessment,
@@ -1085,7 +1143,7 @@ def view_readonly_section(assessment_id, section_id):
             **context)
         
     except Exception as e:
-        logger.error(f"Error loading readonly section view: {e}")
+        logger.error("Error loading readonly section view: %s", e)
         flash('Error loading section', 'error')
         return redirect(url_for('assessment.view_readonly_sections',
                                 assessment_id=assessment_id))
@@ -1098,8 +1156,7 @@ def question(assessment_id, question_id=None):
     Assessment question page
     """
     try:
-        from app.extensions import db
-        assessment_service = AssessmentService(db.session)
+        assessment_service = get_assessment_service()
         
         # Get assessment
         assessment = assessment_service.get_assessment(assessment_id)
@@ -1135,21 +1192,17 @@ def question(assessment_id, question_id=None):
         progress = assessment_service.get_assessment_progress(assessment_id)
         
         # Get question navigation context
-        all_questions = db.session.query(Question).join(Area).join(
-            Section
-        ).order_by(
-            Section.display_order, Area.display_order, Question.display_order
-        ).all()
+        question_ids = get_ordered_question_ids()
         
-        current_index = next(
-            (i for i, q in enumerate(all_questions) if q.id == question_obj.id),
-            0
-        )
+        current_index = get_question_positions().get(question_obj.id, 0)
         
-        prev_question = all_questions[current_index - 1] if current_index > 0 else None
+        prev_question = (
+            db.session.get(Question, question_ids[current_index - 1])
+            if current_index > 0 else None
+        )
         next_question_obj = (
-            all_questions[current_index + 1] 
-            if current_index < len(all_questions) - 1 else None
+            db.session.get(Question, question_ids[current_index + 1])
+            if current_index < len(question_ids) - 1 else None
         )
         
         context = {
@@ -1158,7 +1211,7 @@ def question(assessment_id, question_id=None):
             'existing_response': existing_response,
             'progress': progress,
             'current_index': current_index + 1,
-            'total_questions': len(all_questions),
+            'total_questions': len(question_ids),
             'prev_question': prev_question,
             'next_question': next_question_obj
         }
@@ -1166,7 +1219,7 @@ def question(assessment_id, question_id=None):
         return render_template('pages/assessment/question.html', **context)
         
     except Exception as e:
-        logger.error(f"Error loading question: {e}")
+        logger.error("Error loading question: %s", e)
         flash('Error loading question', 'error')
         return redirect(url_for('assessment.detail', 
                                 assessment_id=assessment_id))
@@ -1230,37 +1283,30 @@ def submit_response(assessment_id):
         
         response = assessment_service.submit_response(**response_data)
         
-        # Update session tracking
-        if 'assessment_responses' not in session:
-            session['assessment_responses'] = {}
-        session['assessment_responses'][str(question_id)] = {
-            'answer_value': answer_value,
-            'notes': notes,
-            'submitted_at': datetime.utcnow().isoformat()
-        }
-        
         # Log response submission
-        logger.info(f"Response submitted for assessment {assessment_id}, "
-                   f"question {question_id}: {answer_value}")
+        logger.info(
+            "Response submitted for assessment %s, question %s: %s",
+            assessment_id, question_id, answer_value
+        )
         
         # Handle navigation based on next_action
         return handle_navigation(assessment_id, question_id, next_action)
         
     except ValidationError as e:
         flash(f'Validation error: {str(e)}', 'error')
-        logger.warning(f"Response validation error: {str(e)}")
+        logger.warning("Response validation error: %s", e)
         return redirect(url_for('assessment.question',
                                 assessment_id=assessment_id,
                                 question_id=question_id))
     except AssessmentError as e:
         flash(f'Assessment error: {str(e)}', 'error')
-        logger.error(f"Assessment submission error: {str(e)}")
+        logger.error("Assessment submission error: %s", e)
         return redirect(url_for('assessment.question',
                                 assessment_id=assessment_id,
                                 question_id=question_id))
     except Exception as e:
         flash('An unexpected error occurred while submitting your response.', 'error')
-        logger.error(f"Unexpected error submitting response: {str(e)}")
+        logger.error("Unexpected error submitting response: %s", e)
         return redirect(url_for('assessment.question',
                                 assessment_id=assessment_id))
 
@@ -1278,24 +1324,18 @@ def handle_navigation(assessment_id, current_question_id, next_action):
         Flask redirect response
     """
     try:
-        from app.extensions import db
         assessment_service = get_assessment_service()
         
         if next_action == 'prev':
             # Navigate to previous question
-            all_questions = db.session.query(Question).join(Area).join(
-                Section
-            ).order_by(
-                Section.display_order, Area.display_order, Question.display_order
-            ).all()
+            question_ids = get_ordered_question_ids()
             
-            current_index = next(
-                (i for i, q in enumerate(all_questions) 
-                 if q.id == current_question_id), 0
+            current_index = get_question_positions().get(
+                current_question_id, 0
             )
             
             if current_index > 0:
-                prev_question_id = all_questions[current_index - 1].id
+                prev_question_id = question_ids[current_index - 1]
                 return redirect(url_for('assessment.question',
                                         assessment_id=assessment_id,
                                         question_id=prev_question_id))
@@ -1310,18 +1350,20 @@ def handle_navigation(assessment_id, current_question_id, next_action):
         
         else:
             # Next question (default)
-            next_question = assessment_service.get_next_question(assessment_id)
-            if next_question:
+            next_question_id = assessment_service.get_next_question_id(
+                assessment_id
+            )
+            if next_question_id:
                 return redirect(url_for('assessment.question',
                                         assessment_id=assessment_id,
-                                        question_id=next_question.id))
+                                        question_id=next_question_id))
             else:
                 # No more questions, redirect to completion
                 return redirect(url_for('assessment.complete',
                                         assessment_id=assessment_id))
     
     except Exception as e:
-        logger.error(f"Navigation error: {str(e)}")
+        logger.error("Navigation error: %s", e)
         return redirect(url_for('assessment.question',
                                 assessment_id=assessment_id))
 
@@ -1332,8 +1374,7 @@ def complete(assessment_id):
     Complete assessment and show completion page
     """
     try:
-        from app.extensions import db
-        assessment_service = AssessmentService(db.session)
+        assessment_service = get_assessment_service()
         
         # Get assessment
         assessment = assessment_service.get_assessment(assessment_id)
@@ -1358,7 +1399,7 @@ def complete(assessment_id):
         return render_template('pages/assessment/complete.html', **context)
         
     except Exception as e:
-        logger.error(f"Error loading completion page: {e}")
+        logger.error("Error loading completion page: %s", e)
         flash('Error loading completion page', 'error')
         return redirect(url_for('assessment.detail',
                                 assessment_id=assessment_id))
@@ -1378,8 +1419,6 @@ def finalize(assessment_id):
             return redirect(url_for('assessment.index'))
         
         assessment_service = get_assessment_service()
-        scoring_service = get_scoring_service()
-        recommendation_service = get_recommendation_service()
         
         # Get assessment and validate status
         assessment = assessment_service.get_assessment(assessment_id)
@@ -1405,62 +1444,49 @@ def finalize(assessment_id):
         
         # Complete assessment with scoring
         try:
-            # Step 1: Mark assessment as completed
-            completed_assessment = assessment_service.complete_assessment(
-                assessment_id, force=force_complete
-            )
-            
-            # Step 2: Calculate comprehensive scores
-            scoring_results = scoring_service.calculate_assessment_score(
-                assessment_id
-            )
-            
-            # Step 3: Generate recommendations
-            recommendations = recommendation_service.generate_recommendations(
-                assessment_id, scoring_results
-            )
-            
-            # Step 4: Update assessment with final results
-            assessment_service.update_assessment_results(
-                assessment_id,
-                scores=scoring_results,
-                recommendations=recommendations
+            # Score and store the results in one UPDATE. The report builds
+            # its own insights, so recommendations are generated on demand
+            # rather than holding up the redirect.
+            assessment_service.finalize_with_results(
+                assessment_id, force=force_complete,
+                include_recommendations=False
             )
             
             # Clear session data as assessment is complete
             clear_assessment_session()
             
             # Log completion
-            metadata = session.get('assessment_metadata', {})
-            organization = metadata.get('organization', 'Unknown')
-            assessor = metadata.get('assessor_name', 'Unknown')
+            organization = assessment.organization_name or 'Unknown'
+            assessor = assessment.assessor_name or 'Unknown'
             
-            logger.info(f"Assessment {assessment_id} completed successfully "
-                       f"for {organization} by {assessor}")
+            logger.info(
+                "Assessment %s completed successfully for %s by %s",
+                assessment_id, organization, assessor
+            )
             
             flash('Assessment completed successfully! Your report is now available.', 'success')
             return redirect(url_for('assessment.report',
                                     assessment_id=assessment_id))
             
         except Exception as scoring_error:
-            logger.error(f"Error during assessment scoring/completion: {scoring_error}")
+            logger.error("Error during assessment scoring/completion: %s", scoring_error)
             flash('Error occurred during scoring. Assessment saved but may need manual review.', 'warning')
             return redirect(url_for('assessment.report',
                                     assessment_id=assessment_id))
         
     except ValidationError as e:
         flash(f'Validation error: {str(e)}', 'error')
-        logger.warning(f"Assessment finalization validation error: {str(e)}")
+        logger.warning("Assessment finalization validation error: %s", e)
         return redirect(url_for('assessment.complete',
                                 assessment_id=assessment_id))
     except AssessmentError as e:
         flash(f'Assessment error: {str(e)}', 'error')
-        logger.error(f"Assessment finalization error: {str(e)}")
+        logger.error("Assessment finalization error: %s", e)
         return redirect(url_for('assessment.complete',
                                 assessment_id=assessment_id))
     except Exception as e:
         flash('An unexpected error occurred during assessment finalization.', 'error')
-        logger.error(f"Unexpected error in assessment finalization: {str(e)}")
+        logger.error("Unexpected error in assessment finalization: %s", e)
         return redirect(url_for('assessment.complete',
                                 assessment_id=assessment_id))
         
@@ -1469,7 +1495,7 @@ def finalize(assessment_id):
         return redirect(url_for('assessment.complete',
                                 assessment_id=assessment_id))
     except Exception as e:
-        logger.error(f"Error finalizing assessment: {e}")
+        logger.error("Error finalizing assessment: %s", e)
         flash('Error finalizing assessment', 'error')
         return redirect(url_for('assessment.complete',
                                 assessment_id=assessment_id))
@@ -1489,37 +1515,212 @@ def _calculate_assessment_duration(assessment):
         str: Human-readable duration
     """
     try:
-        if assessment.completion_date and assessment.created_at:
-            duration = assessment.completion_date - assessment.created_at
+        completion_date = assessment.completion_date
+        created_at = assessment.created_at
+        if completion_date and created_at:
+            duration = completion_date - created_at
             total_minutes = int(duration.total_seconds() / 60)
             
             if total_minutes < 60:
                 return f"{total_minutes} minutes"
-            else:
-                hours = total_minutes // 60
-                minutes = total_minutes % 60
-                if minutes > 0:
-                    return f"{hours} hours {minutes} minutes"
-                else:
-                    return f"{hours} hours"
+            
+            hours, minutes = divmod(total_minutes, 60)
+            if minutes:
+                return f"{hours} hours {minutes} minutes"
+            return f"{hours} hours"
         
         return "Duration not available"
     except Exception:
         return "Duration not available"
 
 
+def _build_report_context(assessment):
+    """
+    Build the template context shared by the HTML and PDF reports
+    
+    Args:
+        assessment: Completed Assessment to report on
+    
+    Returns:
+        dict: Scores, chart data, roadmap and insights for the report templates
+    """
+    # Get all responses for this assessment
+    responses = db.session.query(Response).filter(
+        Response.assessment_id == assessment.id
+    ).all()
+    responses_dict = {r.question_id: r for r in responses}
+    
+    context = {
+        'assessment': assessment,
+        'responses_count': len(responses_dict),
+        'total_questions': get_total_questions(),
+        'completion_date': assessment.completion_date,
+        'organization_name': (
+            assessment.organization_name or assessment.team_name
+        )
+    }
+    
+    # Without responses there is nothing to score, chart or plan, so
+    # skip loading the framework and building the analytics
+    if not responses_dict:
+        context.update(
+            overall_score=0,
+            overall_level=_get_maturity_level_from_score(0),
+            section_scores=[],
+            area_scores={},
+            chart_data=_build_chart_data([]),
+            roadmap_data={},
+            insights=[],
+            priority_areas=[]
+        )
+        return context
+    
+    # Get all sections with areas and questions
+    sections = db.session.query(Section).options(
+        selectinload(Section.areas).selectinload(Area.questions)
+    ).order_by(Section.display_order).all()
+    
+    # Calculate detailed scores
+    section_scores = []
+    area_scores = {}
+    all_scores = []
+    
+    for section in sections:
+        section_responses = []
+        section_areas = []
+        
+        for area in section.areas:
+            area_responses = []
+            for question in area.questions:
+                if question.id in responses_dict:
+                    response_score = responses_dict[question.id].score
+                    area_responses.append(response_score)
+            
+            if area_responses:
+                area_score = fmean(area_responses)
+                area_scores[area.id] = {
+                    'score': area_score,
+                    'name': area.name,
+                    'responses_count': len(area_responses),
+                    'max_possible': len(area.questions) * 4
+                }
+                section_responses.extend(area_responses)
+                section_areas.append({
+                    'id': area.id,
+                    'name': area.name,
+                    'score': area_score,
+                    'level': _get_maturity_level_from_score(area_score),
+                    'responses_count': len(area_responses)
+                })
+        
+        if section_responses:
+            section_score = fmean(section_responses)
+            all_scores.extend(section_responses)
+            
+            section_scores.append({
+                'id': section.id,
+                'name': section.name,
+                'score': section_score,
+                'level': _get_maturity_level_from_score(section_score),
+                'color': _get_section_color(section.id),
+                'areas': section_areas,
+                'responses_count': len(section_responses),
+                'percentage': round((section_score / 4.0) * 100, 1)
+            })
+    
+    # Calculate overall metrics
+    overall_score = round(fmean(all_scores), 1) if all_scores else 0
+    
+    # Progressions for every area, from the per-section cache
+    progressions_by_area = {}
+    for section in sections:
+        progressions_by_area.update(get_section_progressions(section.id))
+    
+    # The framework is already loaded, so resolve questions and their
+    # areas in memory instead of one lookup per response
+    areas_by_id = {
+        area.id: area for section in sections for area in section.areas
+    }
+    questions_by_id = {
+        question.id: question
+        for area in areas_by_id.values()
+        for question in area.questions
+    }
+    
+    # Generate roadmap data for each answered question
+    roadmap_data = {}
+    for question_id, response in responses_dict.items():
+        question = questions_by_id.get(question_id)
+        area = areas_by_id.get(question.area_id) if question else None
+        if area:
+            area_id = area.id
+            current_level = response.score
+            
+            # Get progression data for next levels
+            progressions = progressions_by_area.get(area_id, {})
+            next_levels = []
+            
+            # Up to level 4
+            for target_level in range(current_level + 1, 5):
+                if target_level in progressions:
+                    prog = progressions[target_level]
+                    next_levels.append({
+                        'level': target_level,
+                        'level_name': _get_maturity_level_from_score(
+                            target_level
+                        ),
+                        'prerequisites': _parse_progression_text(
+                            prog['prerequisites']
+                        ),
+                        'action_items': _parse_progression_text(
+                            prog['action_items']
+                        ),
+                        'success_metrics': _parse_progression_text(
+                            prog['success_metrics']
+                        ),
+                        'timeline': prog['timeline'],
+                        'common_pitfalls': _parse_progression_text(
+                            prog['common_pitfall']
+                        ),
+                        'description': prog['prerequisites']  # Fallback
+                    })
+            
+            if next_levels:
+                roadmap_data[question_id] = {
+                    'question': question.question,
+                    'area_name': area.name,
+                    'current_level': current_level,
+                    'current_level_name': _get_maturity_level_from_score(
+                        current_level
+                    ),
+                    'current_description': _get_level_description(
+                        question, current_level
+                    ),
+                    'notes': getattr(response, 'notes', ''),
+                    'next_levels': next_levels
+                }
+    
+    context.update(
+        overall_score=overall_score,
+        overall_level=_get_maturity_level_from_score(overall_score),
+        section_scores=section_scores,
+        area_scores=area_scores,
+        chart_data=_build_chart_data(section_scores),
+        roadmap_data=roadmap_data,
+        insights=_generate_insights(section_scores, overall_score),
+        priority_areas=_identify_priority_areas(section_scores)
+    )
+    return context
+
+
 @assessment_bp.route('/<int:assessment_id>/report')
 def report(assessment_id):
     """
     Modern, interactive assessment report with charts and roadmap
     """
     try:
-        from app.extensions import db
-        from sqlalchemy.orm import joinedload
-        from app.models.progression import get_all_progressions_for_area
-        
         # Get assessment
-        assessment = db.session.query(Assessment).get(assessment_id)
+        assessment = db.session.get(Assessment, assessment_id)
         if not assessment:
             flash('Assessment not found', 'error')
             return redirect(url_for('assessment.index'))
@@ -1529,164 +1730,23 @@ def report(assessment_id):
             return redirect(url_for('assessment.detail',
                                     assessment_id=assessment_id))
         
-        # Get all sections with areas and questions
-        sections = db.session.query(Section).options(
-            joinedload(Section.areas).joinedload(Area.questions)
-        ).order_by(Section.display_order).all()
-        
-        # Get all responses for this assessment
-        responses = db.session.query(Response).filter(
-            Response.assessment_id == assessment_id
-        ).all()
-        responses_dict = {r.question_id: r for r in responses}
-        
-        # Calculate detailed scores
-        section_scores = []
-        area_scores = {}
-        all_scores = []
-        
-        for section in sections:
-            section_responses = []
-            section_areas = []
-            
-            for area in section.areas:
-                area_responses = []
-                for question in area.questions:
-                    if question.id in responses_dict:
-                        response_score = responses_dict[question.id].score
-                        area_responses.append(response_score)
-                
-                if area_responses:
-                    area_score = sum(area_responses) / len(area_responses)
-                    area_scores[area.id] = {
-                        'score': area_score,
-                        'name': area.name,
-                        'responses_count': len(area_responses),
-                        'max_possible': len(area.questions) * 4
-                    }
-                    section_responses.extend(area_responses)
-                    section_areas.append({
-                        'id': area.id,
-                        'name': area.name,
-                        'score': area_score,
-                        'level': _get_maturity_level_from_score(area_score),
-                        'responses_count': len(area_responses)
-                    })
-            
-            if section_responses:
-                section_score = sum(section_responses) / len(section_responses)
-                all_scores.extend(section_responses)
-                
-                section_scores.append({
-                    'id': section.id,
-                    'name': section.name,
-                    'score': section_score,
-                    'level': _get_maturity_level_from_score(section_score),
-                    'color': _get_section_color(section.id),
-                    'areas': section_areas,
-                    'responses_count': len(section_responses),
-                    'percentage': round((section_score / 4.0) * 100, 1)
-                })
-        
-        # Calculate overall metrics
-        overall_score = round(sum(all_scores) / len(all_scores), 1) if all_scores else 0
-        overall_level = _get_maturity_level_from_score(overall_score)
-        
-        # Generate roadmap data for each answered question
-        roadmap_data = {}
-        for question_id, response in responses_dict.items():
-            question = db.session.query(Question).get(question_id)
-            if question and question.area:
-                area_id = question.area.id
-                current_level = response.score
-                
-                # Get progression data for next levels
-                progressions = get_all_progressions_for_area(area_id)
-                next_levels = []
-                
-                # Up to level 4
-                for target_level in range(current_level + 1, 5):
-                    if target_level in progressions:
-                        prog = progressions[target_level]
-                        next_levels.append({
-                            'level': target_level,
-                            'prerequisites': _parse_progression_text(
-                                prog.prerequisites
-                            ),
-                            'action_items': _parse_progression_text(
-                                prog.action_items
-                            ),
-                            'success_metrics': _parse_progression_text(
-                                prog.success_metrics
-                            ),
-                            'timeline': prog.timeline,
-                            'common_pitfalls': _parse_progression_text(
-                                prog.common_pitfall
-                            )
-                        })
-                
-                if next_levels:
-                    roadmap_data[question_id] = {
-                        'question': question.question,
-                        'area_name': question.area.name,
-                        'current_level': current_level,
-                        'current_description': _get_level_description(
-                            question, current_level
-                        ),
-                        'notes': getattr(response, 'notes', ''),
-                        'next_levels': next_levels
-                    }
-        
-        # Prepare chart data
-        chart_data = {
-            'section_scores': [
-                {'name': s['name'], 'score': s['score'], 'color': s['color']}
-                for s in section_scores
-            ],
-            'maturity_distribution': _calculate_maturity_distribution(
-                section_scores
-            ),
-            'area_comparison': [
-                {
-                    'name': area['name'],
-                    'score': area['score'],
-                    'section': section['name']
-                }
-                for section in section_scores
-                for area in section['areas']
-            ]
-        }
+        # Let the browser reuse its copy of an unchanged report. Pending
+        # flash messages must be rendered, so always build the page then.
+        etag = get_report_etag(assessment)
+        has_flashes = '_flashes' in session
+        if etag in request.if_none_match and not has_flashes:
+            not_modified = make_response('', 304)
+            return set_report_cache_headers(not_modified, etag)
         
-        # Generate insights and recommendations
-        insights = _generate_insights(section_scores, overall_score)
-        priority_areas = _identify_priority_areas(section_scores)
+        context = _build_report_context(assessment)
         
-        context = {
-            'assessment': assessment,
-            'overall_score': overall_score,
-            'overall_level': overall_level,
-            'section_scores': section_scores,
-            'area_scores': area_scores,
-            'chart_data': chart_data,
-            'roadmap_data': roadmap_data,
-            'insights': insights,
-            'priority_areas': priority_areas,
-            'responses_count': len(responses_dict),
-            'total_questions': sum(
-                len(area.questions)
-                for section in sections
-                for area in section.areas
-            ),
-            'completion_date': assessment.completion_date,
-            'organization_name': (
-                assessment.organization_name or assessment.team_name
-            )
-        }
-        
-        return render_template('pages/assessment/report.html', **context)
+        response = make_response(
+            render_template('pages/assessment/report.html', **context)
+        )
+        return set_report_cache_headers(response, etag, has_flashes)
         
     except Exception as e:
-        logger.error(f"Error loading report: {e}")
+        logger.error("Error loading report: %s", e)
         flash('Error loading report', 'error')
         return redirect(url_for('assessment.detail',
                                 assessment_id=assessment_id))
@@ -1694,25 +1754,12 @@ def report(assessment_id):
 
 def _get_maturity_level_from_score(score):
     """Convert numeric score to maturity level name"""
-    if score >= 3.3:
-        return 'AI-First'
-    elif score >= 2.5:
-        return 'AI-Augmented'
-    elif score >= 1.8:
-        return 'AI-Assisted'
-    else:
-        return 'Traditional'
+    return MATURITY_LEVEL_NAMES[bisect_right(MATURITY_LEVEL_THRESHOLDS, score)]
 
 
 def _get_section_color(section_id):
     """Get color for section based on ID"""
-    colors = {
-        'FC': '#3b82f6',  # Blue
-        'TC': '#10b981',  # Green
-        'EI': '#f59e0b',  # Yellow
-        'SG': '#ef4444'   # Red
-    }
-    return colors.get(section_id, '#6b7280')
+    return SECTION_COLORS.get(section_id, DEFAULT_SECTION_COLOR)
 
 
 def _parse_progression_text(text):
@@ -1724,30 +1771,31 @@ def _parse_progression_text(text):
 
 def _get_level_description(question, level):
     """Get description for specific level of a question"""
-    level_descriptions = {
-        1: question.level_1_desc,
-        2: question.level_2_desc,
-        3: question.level_3_desc,
-        4: question.level_4_desc
-    }
-    return level_descriptions.get(level, '')
+    if level not in MATURITY_LEVEL_NUMBERS:
+        return ''
+    return getattr(question, f'level_{level}_desc')
 
 
-def _calculate_maturity_distribution(section_scores):
-    """Calculate distribution of maturity levels across sections"""
-    distribution = {
-        'Traditional': 0,
-        'AI-Assisted': 0,
-        'AI-Augmented': 0,
-        'AI-First': 0
-    }
+def _build_chart_data(section_scores):
+    """Build report chart series from section scores in a single pass"""
+    section_series = []
+    distribution = dict.fromkeys(MATURITY_LEVEL_NAMES, 0)
     
     for section in section_scores:
-        level = section['level']
-        if level in distribution:
-            distribution[level] += 1
+        # Only what the charts plot; full section data would bloat the
+        # JSON embedded in the page
+        section_series.append({
+            'name': section['name'],
+            'score': section['score'],
+            'color': section['color']
+        })
+        if section['level'] in distribution:
+            distribution[section['level']] += 1
     
-    return distribution
+    return {
+        'section_scores': section_series,
+        'maturity_distribution': distribution
+    }
 
 
 def _generate_insights(section_scores, overall_score):
@@ -1757,9 +1805,13 @@ def _generate_insights(section_scores, overall_score):
     if not section_scores:
         return insights
     
-    # Find strongest and weakest sections
-    strongest = max(section_scores, key=lambda x: x['score'])
-    weakest = min(section_scores, key=lambda x: x['score'])
+    # Find strongest and weakest sections in a single pass
+    strongest = weakest = section_scores[0]
+    for section in section_scores[1:]:
+        if section['score'] > strongest['score']:
+            strongest = section
+        elif section['score'] < weakest['score']:
+            weakest = section
     
     insights.append({
         'type': 'strength',
@@ -1781,9 +1833,8 @@ def _generate_insights(section_scores, overall_score):
         'icon': 'target'
     })
     
-    # Score variance insight
-    scores = [s['score'] for s in section_scores]
-    variance = max(scores) - min(scores)
+    # Score variance insight (spread between strongest and weakest)
+    variance = strongest['score'] - weakest['score']
     
     if variance > 1.5:
         insights.append({
@@ -1838,8 +1889,7 @@ def progress(assessment_id):
     Assessment progress page for tracking completion
     """
     try:
-        from app.extensions import db
-        assessment_service = AssessmentService(db.session)
+        assessment_service = get_assessment_service()
         
         # Get assessment and progress
         assessment = assessment_service.get_assessment(assessment_id)
@@ -1859,7 +1909,7 @@ def progress(assessment_id):
         return render_template('pages/assessment/progress.html', **context)
         
     except Exception as e:
-        logger.error(f"Error loading progress: {e}")
+        logger.error("Error loading progress: %s", e)
         flash('Error loading progress', 'error')
         return redirect(url_for('assessment.detail',
                                 assessment_id=assessment_id))
@@ -1871,15 +1921,11 @@ def download_pdf(assessment_id):
     Generate and download PDF report
     """
     try:
+        # Optional dependency, only needed for PDF export
         from playwright.sync_api import sync_playwright
-        from app.extensions import db
-        from sqlalchemy.orm import joinedload
-        from app.models.progression import get_all_progressions_for_area
-        import tempfile
-        import os
         
         # Get assessment data (reuse the same logic as report route)
-        assessment = db.session.query(Assessment).get(assessment_id)
+        assessment = db.session.get(Assessment, assessment_id)
         if not assessment:
             flash('Assessment not found', 'error')
             return redirect(url_for('assessment.index'))
@@ -1889,140 +1935,8 @@ def download_pdf(assessment_id):
             return redirect(url_for('assessment.detail',
                                     assessment_id=assessment_id))
 
-        # Get all sections with areas and questions
-        sections = db.session.query(Section).options(
-            joinedload(Section.areas).joinedload(Area.questions)
-        ).order_by(Section.display_order).all()
-
-        # Get all responses for this assessment
-        responses = db.session.query(Response).filter(
-            Response.assessment_id == assessment_id
-        ).all()
-        responses_dict = {r.question_id: r for r in responses}
-
-        # Calculate detailed scores (same logic as report route)
-        section_scores = []
-        area_scores = {}
-        all_scores = []
-
-        for section in sections:
-            section_responses = []
-            section_areas = []
-
-            for area in section.areas:
-                area_responses = []
-                for question in area.questions:
-                    if question.id in responses_dict:
-                        response_score = responses_dict[question.id].score
-                        area_responses.append(response_score)
-
-                if area_responses:
-                    area_score = sum(area_responses) / len(area_responses)
-                    area_scores[area.id] = {
-                        'score': area_score,
-                        'name': area.name,
-                        'responses_count': len(area_responses),
-                        'max_possible': len(area.questions) * 4
-                    }
-                    section_responses.extend(area_responses)
-                    section_areas.append({
-                        'id': area.id,
-                        'name': area.name,
-                        'score': area_score,
-                        'level': _get_maturity_level_from_score(area_score),
-                        'responses_count': len(area_responses)
-                    })
-
-            if section_responses:
-                section_score = sum(section_responses) / len(section_responses)
-                all_scores.extend(section_responses)
-
-                section_scores.append({
-                    'id': section.id,
-                    'name': section.name,
-                    'score': section_score,
-                    'level': _get_maturity_level_from_score(section_score),
-                    'color': _get_section_color(section.id),
-                    'areas': section_areas,
-                    'responses_count': len(section_responses),
-                    'percentage': round((section_score / 4.0) * 100, 1)
-                })
-
-        # Calculate overall metrics
-        overall_score = round(sum(all_scores) / len(all_scores), 1) if all_scores else 0
-        overall_level = _get_maturity_level_from_score(overall_score)
-
-        # Generate chart data
-        chart_data = {
-            'section_scores': section_scores,
-            'maturity_distribution': _calculate_maturity_distribution(section_scores)
-        }
-
-        # Generate roadmap data for each answered question
-        roadmap_data = {}
-        for question_id, response in responses_dict.items():
-            question = db.session.query(Question).get(question_id)
-            if question and question.area:
-                area_id = question.area.id
-                current_level = response.score
-
-                # Get progression data for next levels
-                progressions = get_all_progressions_for_area(area_id)
-                next_levels = []
-
-                # Up to level 4
-                for target_level in range(current_level + 1, 5):
-                    if target_level in progressions:
-                        prog = progressions[target_level]
-                        next_levels.append({
-                            'level': target_level,
-                            'level_name': _get_maturity_level_from_score(target_level),
-                            'prerequisites': _parse_progression_text(prog.prerequisites),
-                            'action_items': _parse_progression_text(prog.action_items),
-                            'success_metrics': _parse_progression_text(prog.success_metrics),
-                            'timeline': prog.timeline,
-                            'common_pitfalls': _parse_progression_text(prog.common_pitfall),
-                            'description': prog.prerequisites  # Fallback
-                        })
-
-                if next_levels:
-                    roadmap_data[question_id] = {
-                        'question': question.question,
-                        'area': question.area.name,
-                        'area_name': question.area.name,  # For template compatibility
-                        'current_level': current_level,
-                        'current_level_name': _get_maturity_level_from_score(current_level),
-                        'current_description': _get_level_description(question, current_level),
-                        'notes': getattr(response, 'notes', ''),
-                        'next_levels': next_levels
-                    }
-
-        # Generate insights and recommendations
-        insights = _generate_insights(section_scores, overall_score)
-        priority_areas = _identify_priority_areas(section_scores)
-
-        context = {
-            'assessment': assessment,
-            'overall_score': overall_score,
-            'overall_level': overall_level,
-            'section_scores': section_scores,
-            'area_scores': area_scores,
-            'chart_data': chart_data,
-            'roadmap_data': roadmap_data,
-            'insights': insights,
-            'priority_areas': priority_areas,
-            'responses_count': len(responses_dict),
-            'total_questions': sum(
-                len(area.questions)
-                for section in sections
-                for area in section.areas
-            ),
-            'completion_date': assessment.completion_date,
-            'organization_name': (
-                assessment.organization_name or assessment.team_name
-            ),
-            'is_pdf': True  # Flag to indicate PDF generation
-        }
+        context = _build_report_context(assessment)
+        context['is_pdf'] = True  # Flag to indicate PDF generation
 
         # Render the same template with PDF-specific styling
         html_content = render_template('pages/assessment/report_pdf.html', **context)
@@ -2066,7 +1980,7 @@ def download_pdf(assessment_id):
         flash('PDF generation not available. Please install Playwright.', 'error')
         return redirect(url_for('assessment.report', assessment_id=assessment_id))
     except Exception as e:
-        logger.error(f"Error generating PDF: {e}")
+        logger.error("Error generating PDF: %s", e)
         flash('Error generating PDF report', 'error')
         return redirect(url_for('assessment.report', assessment_id=assessment_id))
 
@@ -2076,19 +1990,23 @@ def api_progress(assessment_id):
     API endpoint for assessment progress
     """
     try:
-        from app.extensions import db
-        assessment_service = AssessmentService(db.session)
+        assessment_service = get_assessment_service()
         
         progress = assessment_service.get_assessment_progress(assessment_id)
         
-        return jsonify({
+        # Polled while answering, so skip sorting the payload's keys; the
+        # rest of the app keeps the default sorted JSON
+        payload = current_app.json.dumps({
             'status': 'success',
             'data': progress,
             'timestamp': datetime.utcnow().isoformat()
-        })
+        }, sort_keys=False, separators=(',', ':'))
+        return current_app.response_class(
+            f"{payload}\n", mimetype=current_app.json.mimetype
+        )
         
     except Exception as e:
-        logger.error(f"Error fetching progress: {e}")
+        logger.error("Error fetching progress: %s", e)
         return jsonify({
             'status': 'error',
             'message': 'Failed to fetch progress',
@@ -2102,8 +2020,7 @@ def delete_assessment(assessment_id):
     Delete an assessment and all its related data
     """
     try:
-        from app.extensions import db
-        assessment_service = AssessmentService(db.session)
+        assessment_service = get_assessment_service()
         
         # Get assessment to verify it exists and check status
         assessment = assessment_service.get_assessment(assessment_id)
@@ -2135,12 +2052,14 @@ def delete_assessment(assessment_id):
         # SQLAlchemy will handle cascade deletes based on relationships
         db.session.delete(assessment)
         db.session.commit()
+        invalidate_assessment_progress(assessment_id)
+        invalidate_assessment_stats()
         
         # Clear any session data related to this assessment
         if session.get('current_assessment_id') == assessment_id:
             clear_assessment_session()
         
-        logger.info(f"Assessment {assessment_id} ({assessment_name}) deleted successfully")
+        logger.info("Assessment %s (%s) deleted successfully", assessment_id, assessment_name)
         
         if request.method == 'DELETE' or request.headers.get('Content-Type') == 'application/json':
             return jsonify({
@@ -2153,7 +2072,7 @@ def delete_assessment(assessment_id):
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error deleting assessment {assessment_id}: {e}")
+        logger.error("Error deleting assessment %s: %s", assessment_id, e)
         
         if request.method == 'DELETE' or request.headers.get('Content-Type') == 'application/json':
             return jsonify({
@@ -5,7 +5,8 @@ from flask import Blueprint, render_template, jsonify
 from sqlalchemy import func, text
 from datetime import datetime
 
-from app.models import Assessment, Section, Area, Question
+from app.models import Assessment, Section, Area
+from app.core.cache import get_total_questions
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -31,31 +32,22 @@ def index():
                  'WHERE team_name IS NOT NULL')
         ).scalar() or 0
         
-        # Calculate completed assessments for better metrics
-        completed_assessments = db.session.execute(
-            text("SELECT * FROM assessments WHERE status = 'COMPLETED'")
-        ).fetchall()
-        
-        # Calculate average AFS score
-        average_deviq = 0
-        if completed_assessments:
-            deviq_scores = []
-            for assessment in completed_assessments:
-                if (hasattr(assessment, 'overall_score') and
-                        assessment.overall_score):
-                    deviq_scores.append(assessment.overall_score)
-            if deviq_scores:
-                average_deviq = sum(deviq_scores) / len(deviq_scores)
+        # Count completed assessments and average their AFS score
+        completed_count, average_deviq = db.session.execute(
+            text("SELECT COUNT(*), AVG(NULLIF(overall_score, 0)) "
+                 "FROM assessments WHERE status = 'COMPLETED'")
+        ).one()
+        average_deviq = average_deviq or 0
         
         # Calculate completion rate
         completion_rate = 0
         if total_assessments > 0:
-            completed_count = len(completed_assessments)
             completion_rate = (completed_count / total_assessments) * 100
         
         # Get recent assessments (last 10)
         recent_assessments = db.session.execute(
-            text("SELECT * FROM assessments "
+            text("SELECT id, team_name, organization_name, status, "
+            "overall_score, updated_at FROM assessments "
             "WHERE status IN ('COMPLETED', 'IN_PROGRESS') "
             "ORDER BY updated_at DESC LIMIT 10")
         ).fetchall()
@@ -101,9 +93,7 @@ def about():
         # Count framework components
         total_sections = db.session.query(func.count(Section.id)).scalar() or 0
         total_areas = db.session.query(func.count(Area.id)).scalar() or 0
-        total_questions = db.session.query(
-            func.count(Question.id)
-        ).scalar() or 0
+        total_questions = get_total_questions()
         
         # Get sections with their areas for display
         sections = db.session.query(Section).options(
@@ -213,7 +203,7 @@ def api_stats():
             Assessment.status == 'IN_PROGRESS'
         ).count()
         
-        total_questions = db.session.query(Question).count()
+        total_questions = get_total_questions()
         
         # Calculate average score for completed assessments
         completed_with_scores = db.session.query(Assessment).filter(
@@ -0,0 +1,240 @@
+"""
+Framework caching utilities for the AFS Assessment Framework.
+
+Sections, areas and questions are seed data that do not change while the
+application is running, so values derived from them are memoized with the
+shared Flask-Caching instance instead of being re-queried on every request.
+Results derived from completed assessments are cached the same way, keyed
+on the assessment's last update.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+
+from app.extensions import cache, db
+from app.models import Area, Assessment, Question, Section
+from app.models.progression import get_progressions_for_areas
+
+# Framework data only changes when the database is re-seeded or edited;
+# those paths call clear_framework_cache()
+FRAMEWORK_CACHE_TIMEOUT = 3600
+
+# Completed assessment results only change when the assessment row does
+ASSESSMENT_RESULTS_CACHE_TIMEOUT = 3600
+
+# Progress is shared between pages and polling requests for a few seconds;
+# writes that change it call invalidate_assessment_progress()
+ASSESSMENT_PROGRESS_CACHE_TIMEOUT = 2
+
+# Overview counters tolerate brief staleness; creates, deletes and status
+# changes call invalidate_assessment_stats()
+ASSESSMENT_STATS_CACHE_TIMEOUT = 30
+
+
+@cache.memoize(timeout=FRAMEWORK_CACHE_TIMEOUT)
+def get_total_questions() -> int:
+    """
+    Get the total number of questions in the assessment framework.
+
+    Returns:
+        Number of questions
+    """
+    return db.session.query(func.count(Question.id)).scalar() or 0
+
+
+@cache.memoize(timeout=FRAMEWORK_CACHE_TIMEOUT)
+def get_section_order() -> Tuple[Dict[str, Any], ...]:
+    """
+    Get the ID, name and display order of every section.
+
+    Returns:
+        Tuple of {'id', 'name', 'display_order'} dictionaries in display order
+    """
+    rows = (
+        db.session.query(Section.id, Section.name, Section.display_order)
+        .order_by(Section.display_order)
+        .all()
+    )
+    return tuple(
+        {'id': section_id, 'name': name, 'display_order': display_order}
+        for section_id, name, display_order in rows
+    )
+
+
+@cache.memoize(timeout=FRAMEWORK_CACHE_TIMEOUT)
+def get_question_ids_by_section() -> Dict[str, Tuple[str, ...]]:
+    """
+    Get question IDs grouped by section in display order.
+
+    Returns:
+        Dictionary mapping section ID to a tuple of question IDs
+    """
+    rows = (
+        db.session.query(Area.section_id, Question.id)
+        .join(Question, Question.area_id == Area.id)
+        .order_by(Area.section_id, Area.display_order, Question.display_order)
+        .all()
+    )
+
+    questions_by_section: Dict[str, List[str]] = {}
+    for section_id, question_id in rows:
+        questions_by_section.setdefault(section_id, []).append(question_id)
+
+    return {
+        section_id: tuple(question_ids)
+        for section_id, question_ids in questions_by_section.items()
+    }
+
+
+@cache.memoize(timeout=FRAMEWORK_CACHE_TIMEOUT)
+def get_section_positions() -> Dict[str, int]:
+    """
+    Get the navigation position of every section.
+
+    Returns:
+        Dictionary mapping section ID to its index in get_section_order()
+    """
+    return {
+        section['id']: index
+        for index, section in enumerate(get_section_order())
+    }
+
+
+@cache.memoize(timeout=FRAMEWORK_CACHE_TIMEOUT)
+def get_section_progressions(section_id: str) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    """
+    Get serialized maturity progressions for every area in a section.
+
+    Args:
+        section_id: Section ID
+
+    Returns:
+        Dictionary mapping area ID to a dictionary of target level to
+        progression dictionary; every area in the section is present
+    """
+    area_ids = [
+        area_id for area_id, in
+        db.session.query(Area.id).filter(Area.section_id == section_id)
+    ]
+    return {
+        area_id: {
+            level: progression.to_dict()
+            for level, progression in progressions.items()
+        }
+        for area_id, progressions in get_progressions_for_areas(area_ids).items()
+    }
+
+
+@cache.memoize(timeout=FRAMEWORK_CACHE_TIMEOUT)
+def get_ordered_question_ids() -> Tuple[str, ...]:
+    """
+    Get all question IDs in assessment navigation order.
+
+    Returns:
+        Tuple of question IDs ordered by section, area and question
+    """
+    rows = (
+        db.session.query(Question.id)
+        .join(Area, Area.id == Question.area_id)
+        .join(Section, Section.id == Area.section_id)
+        .order_by(Section.display_order, Area.display_order,
+                  Question.display_order)
+        .all()
+    )
+    return tuple(question_id for question_id, in rows)
+
+
+@cache.memoize(timeout=FRAMEWORK_CACHE_TIMEOUT)
+def get_question_positions() -> Dict[str, int]:
+    """
+    Get the navigation position of every question.
+
+    Returns:
+        Dictionary mapping question ID to its index in
+        get_ordered_question_ids()
+    """
+    return {
+        question_id: index
+        for index, question_id in enumerate(get_ordered_question_ids())
+    }
+
+
+def clear_framework_cache() -> None:
+    """
+    Drop every cached framework value after the sections, areas, questions
+    or progressions are seeded or edited.
+    """
+    for memoized in (get_total_questions, get_section_order,
+                     get_question_ids_by_section, get_section_positions,
+                     get_section_progressions, get_ordered_question_ids,
+                     get_question_positions):
+        cache.delete_memoized(memoized)
+
+
+def get_assessment_results_cache_key(kind: str, assessment_id: int,
+                                     updated_at: Optional[datetime],
+                                     *params: Any) -> str:
+    """
+    Build a cache key for results derived from a completed assessment.
+
+    Args:
+        kind: Name of the cached result, e.g. 'recommendations'
+        assessment_id: Assessment ID
+        updated_at: Assessment last update, so edits invalidate the entry
+        *params: Extra arguments the result depends on
+
+    Returns:
+        Cache key string
+    """
+    version = updated_at.isoformat() if updated_at else ''
+    suffix = ':'.join(str(param) for param in params)
+    return f"assessment:{assessment_id}:{version}:{kind}:{suffix}"
+
+
+def get_assessment_progress_cache_key(assessment_id: int) -> str:
+    """
+    Build the cache key for an assessment's progress summary.
+
+    Args:
+        assessment_id: Assessment ID
+
+    Returns:
+        Cache key string
+    """
+    return f"assessment:{assessment_id}:progress"
+
+
+def invalidate_assessment_progress(assessment_id: int) -> None:
+    """
+    Drop the cached progress summary after responses or status change.
+
+    Args:
+        assessment_id: Assessment ID
+    """
+    cache.delete(get_assessment_progress_cache_key(assessment_id))
+
+
+@cache.memoize(timeout=ASSESSMENT_STATS_CACHE_TIMEOUT)
+def get_assessment_status_counts() -> Dict[str, int]:
+    """
+    Get the number of assessments per status.
+
+    Returns:
+        Dictionary mapping status to assessment count
+    """
+    return dict(
+        db.session.query(Assessment.status, func.count(Assessment.id))
+        .filter(Assessment.status.isnot(None))
+        .group_by(Assessment.status)
+        .all()
+    )
+
+
+def invalidate_assessment_stats() -> None:
+    """
+    Drop the cached status counts after an assessment is created, deleted
+    or changes status.
+    """
+    cache.delete_memoized(get_assessment_status_counts)
@@ -12,7 +12,7 @@ from enum import Enum
 
 from sqlalchemy import (
     Column, Integer, String, Text, DateTime, ForeignKey,
-    CheckConstraint, Index, UniqueConstraint, Float
+    CheckConstraint, Index, UniqueConstraint, Float, func
 )
 from sqlalchemy.orm import relationship, validates
 
@@ -92,7 +92,11 @@ class Assessment(BaseModel):
         CheckConstraint("assessment_duration_minutes >= 0", name='check_duration_positive'),
         Index('idx_assessments_status', 'status', 'created_at'),
         Index('idx_assessments_team', 'team_name', 'created_at'),
+        Index('idx_assessments_team_lower',
+              func.lower(team_name).label('lower_team'),
+              postgresql_ops={'lower_team': 'varchar_pattern_ops'}),
         Index('idx_assessments_completion', 'completion_date'),
+        Index('idx_assessments_recent', 'updated_at', 'id'),
         Index('idx_assessments_score', 'overall_score', 'deviq_classification'),
         Index('idx_assessments_team_score', 'team_name', 'overall_score', 'completion_date'),
     )
@@ -156,7 +160,7 @@ class Assessment(BaseModel):
         Args:
             results: Results dictionary
         """
-        self.results_json = json.dumps(results)
+        self.results_json = json.dumps(results, separators=(',', ':'), default=str)
     
     def start_assessment(self) -> None:
         """Mark assessment as started"""
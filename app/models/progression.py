@@ -173,8 +173,38 @@ def get_all_progressions_for_area(
     return {prog.target_level: prog for prog in progressions}
 
 
+def get_progressions_for_areas(
+    area_ids: List[str]
+) -> Dict[str, Dict[int, MaturityProgression]]:
+    """
+    Get all progression data for several areas in a single query
+    
+    Args:
+        area_ids: The area IDs
+    
+    Returns:
+        Dictionary mapping area ID to a dictionary of level to
+        MaturityProgression object; every requested area is present
+    """
+    from app.extensions import db
+    
+    grouped = {area_id: {} for area_id in area_ids}
+    if not grouped:
+        return grouped
+    
+    progressions = db.session.query(MaturityProgression).filter(
+        MaturityProgression.area_id.in_(list(grouped))
+    ).all()
+    
+    for prog in progressions:
+        grouped[prog.area_id][prog.target_level] = prog
+    
+    return grouped
+
+
 __all__ = [
     'MaturityProgression',
     'get_progression_for_area_level',
-    'get_all_progressions_for_area'
+    'get_all_progressions_for_area',
+    'get_progressions_for_areas'
 ]
@@ -3,10 +3,12 @@ Assessment Service Layer
 Implements business logic for assessment creation, management, and completion.
 """
 
+import json
+from bisect import bisect_right
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import and_, func, update
 
 from app.models import (
     Assessment, Section, Area, Question, Response
@@ -17,10 +19,97 @@ from app.utils.validators import AssessmentValidator, ResponseValidator
 from app.utils.exceptions import (
     AssessmentError, ValidationError
 )
+from app.core.cache import (
+    ASSESSMENT_PROGRESS_CACHE_TIMEOUT, get_assessment_progress_cache_key,
+    get_ordered_question_ids, get_question_ids_by_section, get_section_order,
+    get_total_questions, invalidate_assessment_progress,
+    invalidate_assessment_stats
+)
+from app.extensions import cache
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Assessment columns holding the per-section scores, keyed by section ID
+SECTION_SCORE_COLUMNS = {
+    'FC': 'foundational_score',
+    'TC': 'transformation_score',
+    'EI': 'enterprise_score',
+    'SG': 'governance_score',
+}
+
+# Lower score bounds of each DevIQ classification above the first
+DEVIQ_THRESHOLDS = (1.5, 2.5, 3.5)
+DEVIQ_CLASSIFICATIONS = ('Basic', 'Evolving', 'Advanced', 'Optimized')
+
+
+def get_assessment_metadata(assessment):
+    """
+    Build candidate/organization metadata from the assessment row
+    
+    Args:
+        assessment: Assessment instance or row with the metadata columns
+    
+    Returns:
+        dict: Metadata used by templates and stored results
+    """
+    created_at = assessment.created_at
+    return {
+        'assessment_id': assessment.id,
+        'organization_name': (assessment.organization_name or
+                              assessment.team_name or
+                              'Unknown Organization'),
+        'account_name': assessment.account_name or '',
+        'first_name': assessment.first_name or '',
+        'last_name': assessment.last_name or '',
+        'email': assessment.email or '',
+        'industry': assessment.industry or '',
+        'assessor_name': assessment.assessor_name or '',
+        'assessor_email': assessment.assessor_email or '',
+        'created_at': (
+            created_at.isoformat() if isinstance(created_at, datetime)
+            else created_at or ''
+        )
+    }
+
+
+def build_completion_results(assessment, section_scores: Dict[str, float],
+                             overall_score: float,
+                             completion_date: datetime):
+    """
+    Build the DevIQ classification and results_json payload stored when an
+    assessment is completed
+    
+    Args:
+        assessment: Assessment instance or row with the metadata columns
+        section_scores: Score per section ID
+        overall_score: Overall assessment score
+        completion_date: Completion timestamp
+    
+    Returns:
+        Tuple of (deviq_classification, results dictionary)
+    """
+    deviq_classification = DEVIQ_CLASSIFICATIONS[
+        bisect_right(DEVIQ_THRESHOLDS, overall_score)
+    ]
+    metadata = get_assessment_metadata(assessment)
+    results = {
+        'scores': section_scores,
+        'overall_score': overall_score,
+        'deviq_classification': deviq_classification,
+        'metadata': {
+            'organization_name': metadata.get('organization_name'),
+            'account_name': metadata.get('account_name'),
+            'first_name': metadata.get('first_name'),
+            'last_name': metadata.get('last_name'),
+            'email': metadata.get('email'),
+            'industry': metadata.get('industry'),
+            'created_at': metadata.get('created_at'),
+            'completion_date': completion_date.isoformat()
+        }
+    }
+    return deviq_classification, results
+
 
 class AssessmentService:
     """
@@ -91,6 +180,7 @@ class AssessmentService:
             # Save to database
             self.session.add(assessment)
             self.session.commit()
+            invalidate_assessment_stats()
             
             logger.info(f"Created assessment '{name}' for {organization}")
             return assessment
@@ -122,8 +212,10 @@ class AssessmentService:
             )
             
             if include_responses:
+                # Load responses in a separate IN query instead of widening
+                # the assessment row with a joined collection
                 query = query.options(
-                    joinedload(Assessment.responses)
+                    selectinload(Assessment.responses)
                     .joinedload(Response.question)
                     .joinedload(Question.area)
                     .joinedload(Area.section)
@@ -209,11 +301,15 @@ class AssessmentService:
                 logger.debug(f"Created response for question {question_id}")
             
             # Update assessment status if needed
-            if assessment.status == 'draft':
+            status_changed = assessment.status == 'draft'
+            if status_changed:
                 assessment.status = 'in_progress'
                 assessment.updated_at = datetime.now(timezone.utc)
             
             self.session.commit()
+            invalidate_assessment_progress(assessment_id)
+            if status_changed:
+                invalidate_assessment_stats()
             return response
             
         except (ValidationError, AssessmentError):
@@ -234,17 +330,39 @@ class AssessmentService:
         Returns:
             Dictionary with progress information
         """
+        cache_key = get_assessment_progress_cache_key(assessment_id)
+        progress_data = cache.get(cache_key)
+        if progress_data is not None:
+            return progress_data
+        
         try:
-            assessment = self.get_assessment(assessment_id,
-                                             include_responses=True)
+            assessment = self.session.get(Assessment, assessment_id)
             if not assessment:
                 raise AssessmentError(f"Assessment {assessment_id} not found")
             
             # Get total questions count
-            total_questions = self.session.query(func.count(Question.id)).scalar()
+            total_questions = get_total_questions()
+            
+            # Count responses per section in one aggregate instead of
+            # loading every response with its question and area
+            response_rows = (
+                self.session.query(
+                    Area.section_id,
+                    func.count(Response.id),
+                    func.max(Response.timestamp)
+                )
+                .join(Question, Question.id == Response.question_id)
+                .join(Area, Area.id == Question.area_id)
+                .filter(Response.assessment_id == assessment_id)
+                .group_by(Area.section_id)
+                .all()
+            )
+            responded_by_section = {
+                section_id: count for section_id, count, _ in response_rows
+            }
             
             # Get responded questions count
-            responded_questions = len(assessment.responses)
+            responded_questions = sum(responded_by_section.values())
             
             # Calculate progress percentage
             progress_percentage = (
@@ -253,7 +371,9 @@ class AssessmentService:
             )
             
             # Get progress by section
-            section_progress = self._calculate_section_progress(assessment)
+            section_progress = self._calculate_section_progress(
+                responded_by_section
+            )
             
             # Determine if assessment is complete
             is_complete = responded_questions >= total_questions
@@ -267,11 +387,14 @@ class AssessmentService:
                 'section_progress': section_progress,
                 'status': assessment.status,
                 'last_response_date': max(
-                    (r.timestamp for r in assessment.responses),
+                    (last for _, _, last in response_rows if last is not None),
                     default=None
                 )
             }
             
+            cache.set(cache_key, progress_data,
+                      timeout=ASSESSMENT_PROGRESS_CACHE_TIMEOUT)
+            
             logger.debug(f"Calculated progress for assessment {assessment_id}")
             return progress_data
             
@@ -282,13 +405,17 @@ class AssessmentService:
             raise AssessmentError(f"Progress calculation failed: {str(e)}")
     
     def complete_assessment(self, assessment_id: int,
-                            force: bool = False) -> Dict[str, Any]:
+                            force: bool = False,
+                            scoring_results: Optional[Dict[str, Any]] = None
+                            ) -> Dict[str, Any]:
         """
         Complete an assessment and generate final scores and recommendations.
         
         Args:
             assessment_id: Assessment ID to complete
             force: Whether to force completion even if not all questions answered
+            scoring_results: Optional precomputed scoring results to reuse
+                           instead of recalculating them
             
         Returns:
             Dictionary with completion results including scores and
@@ -316,15 +443,18 @@ class AssessmentService:
                     f"/{progress['total_questions']} questions answered"
                 )
             
-            # Calculate final scores
-            scoring_results = self.scoring_service.calculate_assessment_score(
-                assessment_id
-            )
+            # Calculate final scores once and share them with recommendations
+            if scoring_results is None:
+                scoring_results = (
+                    self.scoring_service.calculate_assessment_score(
+                        assessment_id
+                    )
+                )
             
             # Generate recommendations
             recommendations = (
                 self.recommendation_service.generate_assessment_recommendations(
-                    assessment_id
+                    assessment_id, score_results=scoring_results
                 )
             )
             
@@ -347,6 +477,8 @@ class AssessmentService:
             assessment.metadata = existing_metadata
             
             self.session.commit()
+            invalidate_assessment_progress(assessment_id)
+            invalidate_assessment_stats()
             
             # Prepare completion results
             completion_results = {
@@ -371,6 +503,111 @@ class AssessmentService:
             logger.error(f"Failed to complete assessment {assessment_id}: {e}")
             raise AssessmentError(f"Assessment completion failed: {str(e)}")
     
+    def finalize_with_results(self, assessment_id: int,
+                              force: bool = False,
+                              scoring_results: Optional[Dict[str, Any]] = None,
+                              recommendations: Optional[Dict[str, Any]] = None,
+                              include_recommendations: bool = True
+                              ) -> Dict[str, Any]:
+        """
+        Complete an assessment and persist its results in a single UPDATE.
+        
+        Args:
+            assessment_id: Assessment ID to finalize
+            force: Whether to force completion even if not all questions answered
+            scoring_results: Optional precomputed scoring results
+            recommendations: Optional precomputed recommendations
+            include_recommendations: Whether to generate recommendations now;
+                                   when False they are left to be generated
+                                   on demand by RecommendationService
+            
+        Returns:
+            Dictionary with completion results including scores and
+            recommendations
+            
+        Raises:
+            AssessmentError: If finalization fails or assessment incomplete
+        """
+        try:
+            progress = self.get_assessment_progress(assessment_id)
+            
+            if not force and not progress['is_complete']:
+                raise AssessmentError(
+                    f"Assessment incomplete: {progress['responded_questions']}"
+                    f"/{progress['total_questions']} questions answered"
+                )
+            
+            if scoring_results is None:
+                scoring_results = (
+                    self.scoring_service.calculate_assessment_score(
+                        assessment_id
+                    )
+                )
+            
+            if recommendations is None and include_recommendations:
+                recommendations = (
+                    self.recommendation_service
+                    .generate_assessment_recommendations(
+                        assessment_id, score_results=scoring_results
+                    )
+                )
+            
+            completion_date = datetime.utcnow()
+            section_scores = {
+                section['section_id']: section['score']
+                for section in scoring_results['section_scores'].values()
+            }
+            overall_score = scoring_results['deviq_score']
+            deviq_classification, results = build_completion_results(
+                self.session.get(Assessment, assessment_id),
+                section_scores, overall_score, completion_date
+            )
+            if recommendations is not None:
+                results['recommendations'] = recommendations
+            
+            values = {
+                'status': 'COMPLETED',
+                'completion_date': completion_date,
+                'overall_score': overall_score,
+                'deviq_classification': deviq_classification,
+                'results_json': json.dumps(
+                    results, separators=(',', ':'), default=str
+                ),
+            }
+            for section_id, column in SECTION_SCORE_COLUMNS.items():
+                values[column] = section_scores.get(section_id, 0)
+            
+            # Status, scores and results are written together
+            self.session.execute(
+                update(Assessment)
+                .where(Assessment.id == assessment_id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            self.session.commit()
+            invalidate_assessment_progress(assessment_id)
+            invalidate_assessment_stats()
+            
+            logger.info(f"Finalized assessment {assessment_id} with DevIQ "
+                        f"score {scoring_results['deviq_score']}")
+            
+            return {
+                'assessment_id': assessment_id,
+                'status': 'COMPLETED',
+                'completion_date': completion_date,
+                'scores': scoring_results,
+                'recommendations': recommendations,
+                'progress': progress
+            }
+            
+        except AssessmentError:
+            self.session.rollback()
+            raise
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to finalize assessment {assessment_id}: {e}")
+            raise AssessmentError(f"Assessment finalization failed: {str(e)}")
+    
     def get_next_question(self, assessment_id: int) -> Optional[Question]:
         """
         Get the next unanswered question for an assessment.
@@ -381,67 +618,67 @@ class AssessmentService:
         Returns:
             Next Question instance or None if all complete
         """
+        next_question_id = self.get_next_question_id(assessment_id)
+        if next_question_id is None:
+            return None
+        
+        return self.session.get(Question, next_question_id)
+    
+    def get_next_question_id(self, assessment_id: int) -> Optional[str]:
+        """
+        Get the ID of the next unanswered question for an assessment.
+        
+        Args:
+            assessment_id: Assessment ID
+            
+        Returns:
+            Next question ID or None if all complete
+        """
         try:
-            assessment = self.get_assessment(assessment_id,
-                                             include_responses=True)
-            if not assessment:
+            assessment_exists = self.session.query(Assessment.id).filter(
+                Assessment.id == assessment_id
+            ).first()
+            if not assessment_exists:
                 raise AssessmentError(f"Assessment {assessment_id} not found")
             
-            # Get answered question IDs
-            answered_question_ids = {r.question_id for r in assessment.responses}
-            
-            # Find first unanswered question (by display order)
-            next_question = (
-                self.session.query(Question)
-                .join(Area)
-                .join(Section)
-                .filter(Question.id.notin_(answered_question_ids))
-                .order_by(Section.display_order, Area.display_order,
-                          Question.display_order)
-                .first()
-            )
+            # Get answered question IDs without loading Response objects
+            answered_question_ids = {
+                question_id for question_id, in
+                self.session.query(Response.question_id).filter(
+                    Response.assessment_id == assessment_id
+                )
+            }
             
-            return next_question
+            # Find first unanswered question using the cached display order
+            return next(
+                (question_id for question_id in get_ordered_question_ids()
+                 if question_id not in answered_question_ids),
+                None
+            )
             
         except Exception as e:
             logger.error(f"Failed to get next question: {e}")
             raise AssessmentError(f"Failed to get next question: {str(e)}")
     
-    def _calculate_section_progress(self,
-                                    assessment: Assessment) -> Dict[str, Any]:
-        """Calculate progress by section."""
+    def _calculate_section_progress(
+            self, responded_by_section: Dict[str, int]) -> Dict[str, Any]:
+        """Calculate progress by section from response counts per section."""
         try:
-            # Get all sections with question counts
-            sections_data = (
-                self.session.query(
-                    Section.id,
-                    Section.name,
-                    func.count(Question.id).label('total_questions')
-                )
-                .join(Area, Section.id == Area.section_id)
-                .join(Question, Area.id == Question.area_id)
-                .group_by(Section.id, Section.name)
-                .all()
-            )
+            # Question counts per section come from the framework cache
+            questions_by_section = get_question_ids_by_section()
             
-            # Get responses grouped by section
-            responded_by_section = {}
-            for response in assessment.responses:
-                question = response.question
-                section_id = question.area.section_id
-                
-                if section_id not in responded_by_section:
-                    responded_by_section[section_id] = 0
-                responded_by_section[section_id] += 1
-            
-            # Calculate progress for each section
+            # Calculate progress for each section with questions
             section_progress = {}
-            for section_id, section_name, total_questions in sections_data:
+            for section in get_section_order():
+                section_id = section['id']
+                total_questions = len(questions_by_section.get(section_id, ()))
+                if not total_questions:
+                    continue
+                
                 responded = responded_by_section.get(section_id, 0)
-                progress = ((responded / total_questions * 100)
-                            if total_questions > 0 else 0)
+                progress = responded / total_questions * 100
                 
-                section_progress[section_name] = {
+                section_progress[section['name']] = {
                     'section_id': section_id,
                     'total_questions': total_questions,
                     'responded_questions': responded,
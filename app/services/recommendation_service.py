@@ -7,6 +7,10 @@ from typing import Dict, List
 from sqlalchemy.orm import Session
 import logging
 
+from app.core.cache import (
+    ASSESSMENT_RESULTS_CACHE_TIMEOUT, get_assessment_results_cache_key
+)
+from app.extensions import cache
 from app.models.assessment import Assessment
 from app.services.scoring_service import ScoringService
 from app.utils.scoring_utils import classify_maturity_level, ScoringConstants
@@ -37,7 +41,8 @@ class RecommendationService:
 
     def generate_assessment_recommendations(self, assessment_id: int,
                                           max_recommendations: int = 20,
-                                          include_types: List[str] = None) -> Dict:
+                                          include_types: List[str] = None,
+                                          score_results: Dict = None) -> Dict:
         """
         Generate comprehensive recommendations for an assessment
 
@@ -45,6 +50,8 @@ class RecommendationService:
             assessment_id: Assessment ID to generate recommendations for
             max_recommendations: Maximum number of recommendations to return
             include_types: Optional list of recommendation types to include
+            score_results: Optional precomputed scoring results; calculated
+                          when not provided
 
         Returns:
             Dictionary with categorized recommendations
@@ -61,12 +68,26 @@ class RecommendationService:
             if not assessment:
                 raise ValueError(f"Assessment {assessment_id} not found")
 
+            # Recommendations for a completed assessment only change when the
+            # assessment does, so reuse them unless the caller passed scores
+            cache_key = None
+            if score_results is None and assessment.status == 'COMPLETED':
+                cache_key = get_assessment_results_cache_key(
+                    'recommendations', assessment_id, assessment.updated_at,
+                    max_recommendations,
+                    ','.join(sorted(include_types or []))
+                )
+                cached_results = cache.get(cache_key)
+                if cached_results is not None:
+                    return cached_results
+
             logger.info(f"Generating recommendations for assessment {assessment_id}")
 
-            # Get assessment scoring results
-            score_results = self.scoring_service.calculate_assessment_score(
-                assessment_id
-            )
+            # Get assessment scoring results unless the caller already has them
+            if score_results is None:
+                score_results = self.scoring_service.calculate_assessment_score(
+                    assessment_id
+                )
 
             # Generate recommendations for each section
             all_recommendations = []
@@ -119,6 +140,10 @@ class RecommendationService:
             logger.info(f"Generated {len(top_recommendations)} recommendations "
                        f"for assessment {assessment_id}")
 
+            if cache_key:
+                cache.set(cache_key, results,
+                          timeout=ASSESSMENT_RESULTS_CACHE_TIMEOUT)
+
             return results
 
         except Exception as e:
@@ -4,9 +4,11 @@ Calculates AFS scores and maturity classifications
 """
 
 from typing import Dict, List
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 import logging
 
+from app.core.cache import get_total_questions
 from app.models.assessment import Assessment
 from app.models.response import Response
 from app.models.question import Question, Section, Area
@@ -49,10 +51,8 @@ class ScoringService:
             ValueError: If assessment not found or invalid
         """
         try:
-            # Get assessment
-            assessment = self.session.query(Assessment).filter_by(
-                id=assessment_id
-            ).first()
+            # Get assessment; usually already in the session's identity map
+            assessment = self.session.get(Assessment, assessment_id)
 
             if not assessment:
                 raise ValueError(f"Assessment {assessment_id} not found")
@@ -87,7 +87,9 @@ class ScoringService:
                 ),
                 'scoring_metadata': {
                     'calculation_timestamp': assessment.updated_at,
-                    'total_responses': len(assessment.responses),
+                    'total_responses': self.session.query(
+                        func.count(Response.id)
+                    ).filter_by(assessment_id=assessment_id).scalar(),
                     'scoring_version': '1.0'
                 }
             }
@@ -113,15 +115,23 @@ class ScoringService:
         """
         section_scores = {}
 
-        # Get all sections
-        sections = self.session.query(Section).order_by(
-            Section.display_order
-        ).all()
+        # Load the framework tree and this assessment's scores once, then
+        # compute every section and area from memory
+        sections = self.session.query(Section).options(
+            selectinload(Section.areas).selectinload(Area.questions)
+        ).order_by(Section.display_order).all()
+
+        response_scores = dict(
+            self.session.query(Response.question_id, Response.score).filter(
+                Response.assessment_id == assessment_id,
+                Response.score.isnot(None)
+            )
+        )
 
         for section in sections:
             try:
                 score_data = self._calculate_single_section_score(
-                    assessment_id, section.id
+                    section, response_scores
                 )
                 section_scores[section.name.lower().replace(' ', '_')] = {
                     'section_id': section.id,
@@ -153,22 +163,19 @@ class ScoringService:
 
         return section_scores
 
-    def _calculate_single_section_score(self, assessment_id: int,
-                                       section_id: int) -> Dict:
+    def _calculate_single_section_score(self, section: Section,
+                                       response_scores: Dict) -> Dict:
         """
         Calculate score for a single section
 
         Args:
-            assessment_id: Assessment ID
-            section_id: Section ID
+            section: Section with its areas and questions loaded
+            response_scores: Mapping of question ID to response score
 
         Returns:
             Dictionary with section score details
         """
-        # Get all areas in this section
-        areas = self.session.query(Area).filter_by(
-            section_id=section_id
-        ).order_by(Area.display_order).all()
+        areas = section.areas
 
         if not areas:
             return {
@@ -186,7 +193,7 @@ class ScoringService:
         total_questions = 0
 
         for area in areas:
-            area_data = self._calculate_area_score(assessment_id, area.id)
+            area_data = self._calculate_area_score(area, response_scores)
             area_scores.append(area_data['score'])
             area_weights.append(area_data['weight'])
 
@@ -223,21 +230,19 @@ class ScoringService:
             'total_questions': total_questions
         }
 
-    def _calculate_area_score(self, assessment_id: int, area_id: int) -> Dict:
+    def _calculate_area_score(self, area: Area,
+                              response_scores: Dict) -> Dict:
         """
         Calculate score for a single area
 
         Args:
-            assessment_id: Assessment ID
-            area_id: Area ID
+            area: Area with its questions loaded
+            response_scores: Mapping of question ID to response score
 
         Returns:
             Dictionary with area score details
         """
-        # Get all questions in this area with their responses
-        questions = self.session.query(Question).filter_by(
-            area_id=area_id
-        ).order_by(Question.display_order).all()
+        questions = area.questions
 
         if not questions:
             return {
@@ -253,16 +258,13 @@ class ScoringService:
         responses_count = 0
 
         for question in questions:
-            # Get response for this question in this assessment
-            response = self.session.query(Response).filter_by(
-                assessment_id=assessment_id,
-                question_id=question.id
-            ).first()
+            # Get response score for this question in this assessment
+            score = response_scores.get(question.id)
 
-            if response and response.score is not None:
+            if score is not None:
                 # Questions use 1-4 scale directly based on level selection
                 # Normalize to ensure score is within expected range
-                normalized_score = max(1.0, min(4.0, float(response.score)))
+                normalized_score = max(1.0, min(4.0, float(score)))
                 question_scores.append(normalized_score)
                 question_weights.append(1.0)  # Equal weight for all questions
                 responses_count += 1
@@ -347,7 +349,7 @@ class ScoringService:
         ).count()
 
         # Get total questions count
-        total_questions = self.session.query(Question).count()
+        total_questions = get_total_questions()
 
         # Calculate percentages
         completion_percentage = (answered_questions / total_questions * 100
@@ -14,6 +14,7 @@ class DevelopmentConfig(Config):
     # Database settings for development
     SQLALCHEMY_DATABASE_URI = 'sqlite:///app_dev.db'
     SQLALCHEMY_ECHO = True  # Log all SQL queries
+    SQLA_RAISELOAD = True  # Fail on unplanned lazy loads in eager-loaded views
     
     # Cache settings for development
     CACHE_TYPE = 'simple'
@@ -348,9 +348,14 @@ CREATE INDEX idx_questions_active ON questions(is_active, display_order);
 -- Assessment indexes
 CREATE INDEX idx_assessments_status ON assessments(status, created_at);
 CREATE INDEX idx_assessments_team ON assessments(team_name, created_at);
+-- Team prefix search matches a lower(team_name) range here; PostgreSQL needs
+-- the pattern opclass for its anchored LIKE:
+--   CREATE INDEX idx_assessments_team_lower ON assessments(lower(team_name) varchar_pattern_ops);
+CREATE INDEX idx_assessments_team_lower ON assessments(lower(team_name));
 CREATE INDEX idx_assessments_organization ON assessments(organization_name, created_at);
 CREATE INDEX idx_assessments_assessor ON assessments(assessor_name, created_at);
 CREATE INDEX idx_assessments_completion ON assessments(completion_date DESC);
+CREATE INDEX idx_assessments_recent ON assessments(updated_at, id);
 CREATE INDEX idx_assessments_score ON assessments(overall_score, deviq_classification);
 CREATE INDEX idx_assessments_team_score ON assessments(team_name, overall_score, completion_date);
 CREATE INDEX idx_assessments_industry ON assessments(industry, overall_score);
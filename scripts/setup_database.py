@@ -283,6 +283,8 @@ def main():
     print("\n🏁 Database setup script completed!")
     print(f"   You can now use the database at: {db_path}")
     print("   Run your Flask application to test the setup.")
+    print("   If the app is already running against a shared cache, run")
+    print("   'flask clear-framework-cache' so it picks up the new framework.")
 
 
 if __name__ == "__main__":